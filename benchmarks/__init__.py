@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+import os
+import sys
+
+try:
+    import pynq  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
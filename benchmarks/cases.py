@@ -0,0 +1,186 @@
+# benchmarks/cases.py
+from typing import Callable, Iterable, NamedTuple
+from typing import Any, Dict, List, Tuple
+from collections import defaultdict
+from itertools import islice
+import heapq
+from pynq import core
+from pynq.pynquery import PynQuery
+
+
+INT_KINDS = ('list', 'tuple', 'generator', 'range')
+ROW_KINDS = ('rows', 'row_generator')
+
+
+class Case(NamedTuple):
+    name: str
+    kinds: Tuple[str, ...]
+    pynq: Callable[[Callable[[], Iterable[Any]], int, float], Any]
+    baseline: Callable[[Callable[[], Iterable[Any]], int, float], Any]
+    selective: bool = False
+
+
+def make_source(kind: str, size: int) -> Callable[[], Iterable[Any]]:
+    if kind == 'list':
+        data = list(range(size))
+        return lambda: data
+    if kind == 'tuple':
+        data = tuple(range(size))
+        return lambda: data
+    if kind == 'range':
+        return lambda: range(size)
+    if kind == 'generator':
+        return lambda: (x for x in range(size))
+    rows = [{"id": i, "group": i % 100, "value": (i * 7919) % 1000} for i in range(size)]
+    if kind == 'rows':
+        return lambda: rows
+    if kind == 'row_generator':
+        return lambda: (r for r in rows)
+    raise ValueError(f"Unknown source kind: {kind!r}")
+
+
+def _ints(name: str, pynq: Callable[..., Any], baseline: Callable[..., Any], selective: bool = False) -> Case:
+    return Case(name, INT_KINDS, pynq, baseline, selective)
+
+def _rows(name: str, pynq: Callable[..., Any], baseline: Callable[..., Any], selective: bool = False) -> Case:
+    return Case(name, ROW_KINDS, pynq, baseline, selective)
+
+def _cut(n: int, s: float) -> int:
+    return int(n * s)
+
+def _group(r: Dict[str, int]) -> int:
+    return r["group"]
+
+def _value(r: Dict[str, int]) -> int:
+    return r["value"]
+
+def _baseline_group_by(rows: Iterable[Dict[str, int]]) -> List[Tuple[int, List[Any]]]:
+    groups: Dict[int, List[Any]] = defaultdict(list)
+    for r in rows:
+        groups[r["group"]].append(r)
+    return list(groups.items())
+
+def _baseline_group_adjacent(rows: Iterable[Dict[str, int]]) -> List[Tuple[int, List[Any]]]:
+    groups: List[Tuple[int, List[Any]]] = []
+    for r in rows:
+        if groups and groups[-1][0] == r["group"]:
+            groups[-1][1].append(r)
+        else:
+            groups.append((r["group"], [r]))
+    return groups
+
+def _baseline_join(rows: Iterable[Dict[str, int]]) -> List[Tuple[Any, Any]]:
+    names = {g: f"group-{g}" for g in range(100)}
+    return [(r, names[r["group"]]) for r in rows if r["group"] in names]
+
+def _baseline_left_join(rows: Iterable[Dict[str, int]]) -> List[Tuple[Any, Any]]:
+    names = {g: f"group-{g}" for g in range(50)}
+    return [(r, names.get(r["group"])) for r in rows]
+
+def _baseline_group_join(rows: Iterable[Dict[str, int]]) -> List[Tuple[Any, int]]:
+    counts: Dict[int, int] = defaultdict(int)
+    for g, _ in _GROUP_NAMES:
+        counts[g] += 1
+    return [(r, counts.get(r["group"], 0)) for r in rows]
+
+def _baseline_distinct_by(seq: Iterable[int], excluded: set) -> List[int]:
+    seen: Dict[int, int] = {}
+    for x in seq:
+        if x % 1000 not in excluded:
+            seen.setdefault(x % 1000, x)
+    return list(seen.values())
+
+def _baseline_union_by(seq: Iterable[int], other: Iterable[int]) -> List[int]:
+    seen: Dict[int, int] = {}
+    for x in list(seq) + list(other):
+        seen.setdefault(x % 1000, x)
+    return list(seen.values())
+
+def _baseline_intersect_by(seq: Iterable[int], other: Iterable[int]) -> List[int]:
+    keys = {x % 1000 for x in other}
+    seen: Dict[int, int] = {}
+    for x in seq:
+        if x % 1000 in keys:
+            seen.setdefault(x % 1000, x)
+    return list(seen.values())
+
+_GROUP_NAMES = [(g, f"group-{g}") for g in range(100)]
+
+
+CORE_CASES: List[Case] = [
+    _ints('count', lambda src, n, s: core.count(src()), lambda src, n, s: sum(1 for _ in src())),
+    _ints('count_predicate', lambda src, n, s: core.count(src(), lambda x: x < _cut(n, s)), lambda src, n, s: sum(1 for x in src() if x < _cut(n, s)), True),
+    _ints('to_list', lambda src, n, s: core.to_list(src()), lambda src, n, s: list(src())),
+    _ints('has', lambda src, n, s: core.has(src(), lambda x: x >= _cut(n, s)), lambda src, n, s: any(x >= _cut(n, s) for x in src()), True),
+    _ints('has_any', lambda src, n, s: core.has_any(src()), lambda src, n, s: next(iter(src()), None) is not None),
+    _ints('sum_of', lambda src, n, s: core.sum_of(src()), lambda src, n, s: sum(src())),
+    _ints('avg_of', lambda src, n, s: core.avg_of(src()), lambda src, n, s: (lambda v: sum(v) / len(v) if v else None)(list(src()))),
+    _ints('min_of', lambda src, n, s: core.min_of(src()), lambda src, n, s: min(src(), default=None)),
+    _ints('max_of', lambda src, n, s: core.max_of(src()), lambda src, n, s: max(src(), default=None)),
+    _ints('stats', lambda src, n, s: core.stats(src()), lambda src, n, s: (lambda v: (len(v), sum(v), min(v, default=None), max(v, default=None)))(list(src()))),
+    _ints('distinct', lambda src, n, s: list(core.distinct(x % 1000 for x in src())), lambda src, n, s: list(dict.fromkeys(x % 1000 for x in src()))),
+    _ints('contains', lambda src, n, s: core.contains(src(), _cut(n, s)), lambda src, n, s: _cut(n, s) in src(), True),
+    _ints('first_predicate', lambda src, n, s: core.first_or_default(src(), lambda x: x >= _cut(n, s)), lambda src, n, s: next((x for x in src() if x >= _cut(n, s)), None), True),
+    _ints('last', lambda src, n, s: core.last(src()) if n else None, lambda src, n, s: (lambda v: v[-1] if v else None)(list(src()))),
+    _ints('last_or_default', lambda src, n, s: core.last_or_default(src()), lambda src, n, s: (lambda v: v[-1] if v else None)(list(src()))),
+    _ints('take', lambda src, n, s: list(core.take(src(), _cut(n, s))), lambda src, n, s: list(islice(src(), _cut(n, s))), True),
+    _ints('take_last', lambda src, n, s: list(core.take_last(src(), 10)), lambda src, n, s: list(src())[-10:]),
+    _ints('skip', lambda src, n, s: list(core.skip(src(), _cut(n, s))), lambda src, n, s: list(islice(src(), _cut(n, s), None)), True),
+    _ints('skip_last', lambda src, n, s: list(core.skip_last(src(), 10)), lambda src, n, s: list(src())[:-10]),
+    _ints('where', lambda src, n, s: list(core.where(src(), lambda x: x < _cut(n, s))), lambda src, n, s: [x for x in src() if x < _cut(n, s)], True),
+    _ints('select', lambda src, n, s: list(core.select(src(), lambda x: x * 2)), lambda src, n, s: [x * 2 for x in src()]),
+    _ints('select_many', lambda src, n, s: list(core.select_many(src(), lambda x: (x, x))), lambda src, n, s: [y for x in src() for y in (x, x)]),
+    _ints('with_min', lambda src, n, s: core.with_min(src(), None, lambda x: x % 1000), lambda src, n, s: (lambda v, m: [x for x in v if x % 1000 == m])(*(lambda v: (v, min((x % 1000 for x in v), default=None)))(list(src())))),
+    _ints('with_max', lambda src, n, s: core.with_max(src(), None, lambda x: x % 1000), lambda src, n, s: (lambda v, m: [x for x in v if x % 1000 == m])(*(lambda v: (v, max((x % 1000 for x in v), default=None)))(list(src())))),
+    _ints('min_max_by', lambda src, n, s: core.min_max_by(src(), lambda x: -x) if n else None, lambda src, n, s: (lambda v: (min(v, key=lambda x: -x), max(v, key=lambda x: -x)))(list(src())) if n else None),
+    _ints('order_by', lambda src, n, s: core.order_by(src(), lambda x: -x), lambda src, n, s: sorted(src(), key=lambda x: -x)),
+    _ints('order_by_desc', lambda src, n, s: core.order_by_desc(src(), lambda x: x % 1000), lambda src, n, s: sorted(src(), key=lambda x: x % 1000, reverse=True)),
+    _ints('take_ordered', lambda src, n, s: core.take_ordered(src(), 20, lambda x: -x), lambda src, n, s: sorted(src(), key=lambda x: -x)[:20]),
+    _ints('aggregate', lambda src, n, s: core.aggregate(src(), lambda a, b: a + b, 0), lambda src, n, s: sum(src())),
+    _ints('concatenate', lambda src, n, s: list(core.concatenate(src(), src())), lambda src, n, s: list(src()) + list(src())),
+    _ints('union', lambda src, n, s: list(core.union(src(), range(_cut(n, s)))), lambda src, n, s: list(dict.fromkeys(list(src()) + list(range(_cut(n, s))))), True),
+    _ints('intersect', lambda src, n, s: list(core.intersect(src(), range(_cut(n, s)))), lambda src, n, s: (lambda o: [x for x in src() if x in o])(set(range(_cut(n, s)))), True),
+    _ints('except_', lambda src, n, s: list(core.except_(src(), range(_cut(n, s)))), lambda src, n, s: (lambda o: [x for x in src() if x not in o])(set(range(_cut(n, s)))), True),
+    _ints('chunk', lambda src, n, s: sum(sum(c) for c in core.chunk(src(), 1000)), lambda src, n, s: (lambda v: sum(sum(v[i:i + 1000]) for i in range(0, len(v), 1000)))(list(src()))),
+    _ints('batch_select', lambda src, n, s: list(core.batch_select(src(), lambda b: [sum(b)], 1000)), lambda src, n, s: (lambda v: [sum(v[i:i + 1000]) for i in range(0, len(v), 1000)])(list(src()))),
+    _ints('first', lambda src, n, s: core.first(src()) if n else None, lambda src, n, s: next(iter(src()), None)),
+    _ints('first_or_default', lambda src, n, s: core.first_or_default(src()), lambda src, n, s: next(iter(src()), None)),
+    _ints('contains_all', lambda src, n, s: core.contains_all(src(), range(_cut(n, s))), lambda src, n, s: set(range(_cut(n, s))) <= set(src()), True),
+    _ints('distinct_by', lambda src, n, s: list(core.distinct_by(src(), lambda x: x % 1000)), lambda src, n, s: _baseline_distinct_by(src(), set())),
+    _ints('union_by', lambda src, n, s: list(core.union_by(src(), range(_cut(n, s)), lambda x: x % 1000)), lambda src, n, s: _baseline_union_by(src(), range(_cut(n, s))), True),
+    _ints('intersect_by', lambda src, n, s: list(core.intersect_by(src(), range(_cut(n, s)), lambda x: x % 1000)), lambda src, n, s: _baseline_intersect_by(src(), range(_cut(n, s))), True),
+    _ints('except_by', lambda src, n, s: list(core.except_by(src(), range(_cut(n, s)), lambda x: x % 1000)), lambda src, n, s: _baseline_distinct_by(src(), {x % 1000 for x in range(_cut(n, s))}), True),
+    _ints('min_by', lambda src, n, s: core.min_by(src(), lambda x: -x) if n else None, lambda src, n, s: min(src(), key=lambda x: -x, default=None)),
+    _ints('max_by', lambda src, n, s: core.max_by(src(), lambda x: x % 1000) if n else None, lambda src, n, s: max(src(), key=lambda x: x % 1000, default=None)),
+    _ints('take_ordered_desc', lambda src, n, s: core.take_ordered_desc(src(), 20, lambda x: x % 1000), lambda src, n, s: heapq.nlargest(20, src(), key=lambda x: x % 1000)),
+    _ints('select_concurrent', lambda src, n, s: list(core.select_concurrent(src(), lambda x: x * 2, 4)), lambda src, n, s: [x * 2 for x in src()]),
+    _ints('aggregate_many', lambda src, n, s: core.aggregate_many(src(), n='count', total=('sum',), top='max'), lambda src, n, s: (lambda v: {"n": len(v), "total": sum(v), "top": max(v, default=None)})(list(src()))),
+    _rows('group_by', lambda src, n, s: list(core.group_by(src(), _group)), lambda src, n, s: _baseline_group_by(src())),
+    _rows('group_adjacent', lambda src, n, s: list(core.group_adjacent(src(), _group)), lambda src, n, s: _baseline_group_adjacent(src())),
+    _rows('group_aggregate', lambda src, n, s: list(core.group_aggregate(src(), _group, n='count', total=('sum', _value))), lambda src, n, s: [(k, {"n": len(v), "total": sum(r["value"] for r in v)}) for k, v in _baseline_group_by(src())]),
+    _rows('to_lookup', lambda src, n, s: core.to_lookup(src(), _group), lambda src, n, s: dict(_baseline_group_by(src()))),
+    _rows('join', lambda src, n, s: list(core.join(src(), _GROUP_NAMES, _group, lambda g: g[0], lambda r, g: (r, g[1]))), lambda src, n, s: _baseline_join(src())),
+    _rows('to_dict', lambda src, n, s: core.to_dict(src(), lambda r: r["id"]), lambda src, n, s: {r["id"]: r for r in src()}),
+    _rows('order_by_keys', lambda src, n, s: core.order_by_keys(src(), ((_group, False), (_value, True))), lambda src, n, s: sorted(src(), key=lambda r: (r["group"], -r["value"]))),
+    _rows('take_ordered_keys', lambda src, n, s: core.take_ordered_keys(src(), 20, ((_group, False), (_value, True))), lambda src, n, s: heapq.nsmallest(20, src(), key=lambda r: (r["group"], -r["value"]))),
+    _rows('group_by_compact', lambda src, n, s: list(core.group_by_compact(src(), _group)), lambda src, n, s: _baseline_group_by(src())),
+    _rows('left_join', lambda src, n, s: list(core.left_join(src(), _GROUP_NAMES[:50], _group, lambda g: g[0], lambda r, g: (r, g and g[1]))), lambda src, n, s: _baseline_left_join(src())),
+    _rows('group_join', lambda src, n, s: list(core.group_join(src(), _GROUP_NAMES, _group, lambda g: g[0], lambda r, gs: (r, len(gs)))), lambda src, n, s: _baseline_group_join(src())),
+    _rows('sum_of_selector', lambda src, n, s: core.sum_of(src(), None, _value), lambda src, n, s: sum(r["value"] for r in src())),
+]
+
+
+QUERY_CASES: List[Case] = [
+    _ints('query_where_select_take', lambda src, n, s: PynQuery(src()).where(lambda x: x % 2 == 0).select(lambda x: x * 3).where(lambda x: x < _cut(n, s) * 3).take(10).to_list(), lambda src, n, s: list(islice((y for y in (x * 3 for x in src() if x % 2 == 0) if y < _cut(n, s) * 3), 10)), True),
+    _ints('query_where_count', lambda src, n, s: PynQuery(src()).where(lambda x: x < _cut(n, s)).count(), lambda src, n, s: sum(1 for x in src() if x < _cut(n, s)), True),
+    _ints('query_select_sum', lambda src, n, s: PynQuery(src()).select(lambda x: x * 0.5).sum(), lambda src, n, s: sum(x * 0.5 for x in src())),
+    _ints('query_order_by_take', lambda src, n, s: PynQuery(src()).order_by_desc(lambda x: x % 1000).take(20).to_list(), lambda src, n, s: sorted(src(), key=lambda x: x % 1000, reverse=True)[:20]),
+    _ints('query_order_by_first', lambda src, n, s: PynQuery(src()).order_by(lambda x: -x).first_or_default(), lambda src, n, s: next(iter(sorted(src(), key=lambda x: -x)), None)),
+    _ints('query_take_last', lambda src, n, s: PynQuery(src()).where(lambda x: x < _cut(n, s)).take_last(10).to_list(), lambda src, n, s: [x for x in src() if x < _cut(n, s)][-10:], True),
+    _rows('query_group_count', lambda src, n, s: PynQuery(src()).group_by(_group).select(lambda g: (g.key, g.as_queryable().count())).to_list(), lambda src, n, s: [(k, len(v)) for k, v in _baseline_group_by(src())]),
+    _rows('query_then_by', lambda src, n, s: PynQuery(src()).order_by(_group).then_by_desc(_value).to_list(), lambda src, n, s: sorted(sorted(src(), key=_value, reverse=True), key=_group)),
+    _rows('query_top_k_rows', lambda src, n, s: PynQuery(src()).where(lambda r: r["id"] < _cut(n, s)).order_by_desc(_value).take(20).to_list(), lambda src, n, s: heapq.nlargest(20, (r for r in src() if r["id"] < _cut(n, s)), key=_value), True),
+]
+
+
+ALL_CASES: List[Case] = CORE_CASES + QUERY_CASES
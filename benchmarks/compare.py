@@ -0,0 +1,60 @@
+# benchmarks/compare.py
+from typing import Optional
+from typing import Any, Dict, List, Tuple
+import argparse
+import json
+import sys
+
+
+Key = Tuple[Any, ...]
+
+
+def load(path: str) -> Dict[Key, Dict[str, Any]]:
+    records: Dict[Key, Dict[str, Any]] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                records[_key(record)] = record
+    return records
+
+def compare(old: Dict[Key, Dict[str, Any]], new: Dict[Key, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = []
+    for key in sorted(old.keys() & new.keys(), key=repr):
+        before, after = old[key], new[key]
+        rows.append(dict(zip(('case', 'kind', 'size', 'selectivity', 'impl'), key),
+                         time_ratio=_ratio(after['seconds'], before['seconds']),
+                         memory_ratio=_ratio(after['peak_bytes'], before['peak_bytes'])))
+    return rows
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Diff two benchmark result files.")
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=None, help="exit with 1 if any time ratio exceeds this")
+    args = parser.parse_args(argv)
+    rows = compare(load(args.old), load(args.new))
+    regressed = False
+    for row in rows:
+        mark = ''
+        if args.threshold is not None and row['time_ratio'] is not None and row['time_ratio'] > args.threshold:
+            mark, regressed = ' REGRESSION', True
+        print(f"{row['case']:<28} {row['kind']:<14} {row['size']:>9} {str(row['selectivity']):>5} {row['impl']:<8} "
+              f"time x{_fmt(row['time_ratio'])} mem x{_fmt(row['memory_ratio'])}{mark}")
+    return 1 if regressed else 0
+
+
+# PRIVATE
+
+def _key(record: Dict[str, Any]) -> Key:
+    return (record['case'], record['kind'], record['size'], record['selectivity'], record['impl'])
+
+def _ratio(after: float, before: float) -> Optional[float]:
+    return after / before if before else None
+
+def _fmt(ratio: Optional[float]) -> str:
+    return 'n/a' if ratio is None else f"{ratio:.2f}"
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# benchmarks/run.py
+from typing import Callable, Iterable, Optional
+from typing import Any, Dict, List, Sequence, TextIO
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from .cases import ALL_CASES, Case, make_source
+
+
+DEFAULT_SIZES = (100, 10_000, 100_000)
+DEFAULT_SELECTIVITIES = (0.01, 0.5, 0.99)
+
+
+def pynq_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version('pynq')
+    except Exception:
+        return 'unknown'
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        _drain(func())
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _drain(func())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+def run(cases: Sequence[Case], sizes: Sequence[int], selectivities: Sequence[float], repeat: int, kinds: Optional[Sequence[str]] = None) -> Iterable[Dict[str, Any]]:
+    meta = {"version": pynq_version(), "python": platform.python_version()}
+    for case in cases:
+        for kind in case.kinds:
+            if kinds and kind not in kinds:
+                continue
+            for size in sizes:
+                source = make_source(kind, size)
+                for selectivity in (selectivities if case.selective else (None,)):
+                    for impl, func in (("pynq", case.pynq), ("baseline", case.baseline)):
+                        result = measure(lambda: func(source, size, selectivity), repeat)
+                        yield dict(meta, case=case.name, kind=kind, size=size, selectivity=selectivity, impl=impl, **result)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pynq operators against plain-Python baselines.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--selectivities', type=float, nargs='+', default=list(DEFAULT_SELECTIVITIES))
+    parser.add_argument('--kinds', nargs='+', default=None)
+    parser.add_argument('--cases', nargs='+', default=None, help="only run cases whose name contains one of these")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', default='-', help="JSON Lines output file, '-' for stdout")
+    args = parser.parse_args(argv)
+    cases = [c for c in ALL_CASES if not args.cases or any(name in c.name for name in args.cases)]
+    out: TextIO = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for record in run(cases, args.sizes, args.selectivities, args.repeat, args.kinds):
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+# PRIVATE
+
+def _drain(result: Any) -> None:
+    if hasattr(result, '__next__'):
+        for _ in result:
+            pass
+
+
+if __name__ == '__main__':
+    sys.exit(main())
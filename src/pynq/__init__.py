@@ -1,25 +1,58 @@
 # pynq/__init__.py
 from .core import (
     count,
-    to_list,
+    to_list, to_lookup, to_dict,
     has, has_any,
-    where, distinct,
+    where, distinct, distinct_by,
+    union, union_by,
+    intersect, intersect_by,
+    except_, except_by,
     sum_of, avg_of,
     min_of, max_of,
+    stats, aggregate_many,
     with_min, with_max,
-    select, select_many,
+    min_by, max_by, min_max_by,
+    select, select_many, select_concurrent,
     last, last_or_default,
     first, first_or_default,
     take, take_last,
     skip, skip_last,
     contains, contains_all,
     order_by, order_by_desc,
+    order_by_keys,
+    take_ordered, take_ordered_desc, take_ordered_keys,
     concatenate, aggregate,
-    group_by
+    chunk, batch_select,
+    group_by, group_by_compact, group_adjacent, group_aggregate,
+    join, left_join, group_join
+)
+from .pynstats import (
+    PynStats
+)
+from .pynprofile import (
+    PynProfile, PynStageProfile, set_profile_hook
+)
+from .pynexpr import (
+    F, PynExpr
 )
 from .pyngrouping import (
-    PynGrouping
+    PynGrouping, PynGroupIndex, PynGroupView
 )
 from .pynquery import (
     PynQuery
 )
+from .pynparallel import (
+    PynParallelQuery
+)
+from .pynasync import (
+    AsyncPynQuery
+)
+from .pynmemo import (
+    PynMemo
+)
+from .pynindexed import (
+    PynIndexedQuery
+)
+from .sources import (
+    read_lines, read_csv, read_jsonl
+)
@@ -1,8 +1,21 @@
 # pynq/core.py
 from typing import Callable, Iterable, Optional
-from typing import Any, List, Dict, Tuple, TypeVar
-from collections import defaultdict
-from itertools import islice
+from typing import Any, List, Dict, Tuple, TypeVar, Sequence, Sized, Container, Reversible, Iterator, Union
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice, groupby, chain
+from array import array
+from decimal import Decimal
+import heapq
+import operator
+import math
+import os
+import pickle
+import tempfile
+from .numeric import is_ndarray, as_array, reduce_sum, reduce_avg, reduce_min, reduce_max
+from .pynstats import PynStats
+from .pyngrouping import PynGroupIndex
+from .pynexpr import compiled
 
 
 # FOOL OF A ...
@@ -10,59 +23,91 @@ T = TypeVar('T')
 U = TypeVar('U')
 K = TypeVar('K')
 
+_MISSING = object()
+
 
 # BASIC
 def has_any(seq: Iterable[T]) -> bool:
-    try:
-        test = seq[0]
+    if isinstance(seq, Sized):
+        return len(seq) > 0
+    for _ in seq:
         return True
-    except:
-        return False
+    return False
 
 def to_list(seq: Iterable[T]) -> List[T]:
     return list(seq)
 
+def to_lookup(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> Dict[K, List[U]]:
+    lookup: Dict[K, List[U]] = {}
+    for item in seq:
+        key = key_selector(item)
+        value = value_selector(item) if value_selector is not None else item
+        values = lookup.get(key)
+        if values is None:
+            lookup[key] = [value]
+        else:
+            values.append(value)
+    return lookup
+
+def to_dict(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> Dict[K, U]:
+    result: Dict[K, U] = {}
+    for item in seq:
+        key = key_selector(item)
+        if key in result:
+            raise ValueError(f"Duplicate key: {key!r}")
+        result[key] = value_selector(item) if value_selector is not None else item
+    return result
+
 def has(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None) -> bool:
-    return any(predicate(x) if predicate else x for x in seq)
+    return any(predicate(x) if predicate is not None else x for x in seq)
 
 def count(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None) -> int:
+    if predicate is None and isinstance(seq, Sized):
+        return len(seq)
     if isinstance(seq, (list, tuple)):
-        return len([x for x in seq if x]) if predicate is None else len([x for x in seq if predicate(x)])
+        return len([x for x in seq if predicate(x)])
     return sum(1 for x in seq if predicate is None or predicate(x))
 
 def sum_of(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, selector: Optional[Callable[[T], K]] = None) -> T:
-    return sum(_filter(seq, predicate, selector))
+    return reduce_sum(_filter(seq, predicate, selector))
 
 def avg_of(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> float:
-    filtered = _filter(seq, predicate, key_selector)
-    val = next(filtered, None)
-    if not val:
-        return val
-    items = 0
-    total = 0
-    while val:
-        items += 1
-        total += val
-        val = next(filtered, None)
-    return total / items
+    return reduce_avg(_filter(seq, predicate, key_selector))
 
 def min_of(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, selector: Optional[Callable[[T], K]] = None) -> T:
-    filtered = _filter(seq, predicate, selector)
-    cur = next(filtered, None)
-    if cur:
-        for x in filtered:
-            if x < cur:
-                cur = x
-    return cur
+    return reduce_min(_filter(seq, predicate, selector))
 
 def max_of(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, selector: Optional[Callable[[T], K]] = None) -> T:
-    filtered = _filter(seq, predicate, selector)
-    cur = next(filtered, None)
-    if cur:
-        for x in filtered:
-            if x > cur:
-                cur = x
-    return cur
+    return reduce_max(_filter(seq, predicate, selector))
+
+def stats(seq: Iterable[T], selector: Optional[Callable[[T], K]] = None, ddof: int = 0) -> PynStats:
+    values = seq if selector is None else map(selector, seq)
+    arr = as_array(values)
+    if arr is not None:
+        return _array_stats(arr, ddof)
+    it = iter(values)
+    first = next(it, _MISSING)
+    if first is _MISSING:
+        return PynStats(0, 0, None, None, None, None, None)
+    n, total, lo, hi = 1, first, first, first
+    mean, m2 = first, first - first
+    for x in it:
+        n += 1
+        total += x
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    variance = m2 / (n - ddof) if n > ddof else None
+    return PynStats(n, total, lo, hi, total / n, variance, _sqrt(variance) if variance is not None else None)
+
+def aggregate_many(seq: Iterable[T], **aggregates: Any) -> Dict[str, Any]:
+    for _, results in group_aggregate(seq, _constant_key, **aggregates):
+        return results
+    return {name: finish(seed()) for name, (seed, _, finish) in zip(aggregates, map(_accumulator, aggregates.values()))}
 
 def distinct(seq: Iterable[T]) -> Iterable[T]:
     seen = set()
@@ -71,7 +116,56 @@ def distinct(seq: Iterable[T]) -> Iterable[T]:
             seen.add(item)
             yield item
 
+def distinct_by(seq: Iterable[T], key_selector: Callable[[T], K]) -> Iterable[T]:
+    seen = set()
+    for item in seq:
+        key = key_selector(item)
+        if key not in seen:
+            seen.add(key)
+            yield item
+
+def union(seq: Iterable[T], other: Iterable[T]) -> Iterable[T]:
+    return distinct(concatenate(seq, other))
+
+def union_by(seq: Iterable[T], other: Iterable[T], key_selector: Callable[[T], K]) -> Iterable[T]:
+    return distinct_by(concatenate(seq, other), key_selector)
+
+def intersect(seq: Iterable[T], other: Iterable[T]) -> Iterable[T]:
+    pending = set(other)
+    for item in seq:
+        if item in pending:
+            pending.discard(item)
+            yield item
+
+def intersect_by(seq: Iterable[T], other: Iterable[T], key_selector: Callable[[T], K]) -> Iterable[T]:
+    pending = set(map(key_selector, other))
+    for item in seq:
+        key = key_selector(item)
+        if key in pending:
+            pending.discard(key)
+            yield item
+
+def except_(seq: Iterable[T], other: Iterable[T]) -> Iterable[T]:
+    seen = set(other)
+    for item in seq:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+def except_by(seq: Iterable[T], other: Iterable[T], key_selector: Callable[[T], K]) -> Iterable[T]:
+    seen = set(map(key_selector, other))
+    for item in seq:
+        key = key_selector(item)
+        if key not in seen:
+            seen.add(key)
+            yield item
+
 def contains(seq: Iterable[T], item: T) -> bool:
+    if isinstance(seq, Container) and not isinstance(seq, (str, bytes)):
+        try:
+            return item in seq
+        except TypeError:
+            pass
     return next((True for x in seq if x == item), False)
 
 def contains_all(seq: Iterable[T], items: Iterable[T]) -> bool:
@@ -83,38 +177,41 @@ def contains_all(seq: Iterable[T], items: Iterable[T]) -> bool:
     return False
 
 def first(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None) -> T:
-    return seq[0] if not predicate and isinstance(seq, Sequence) else next((x for x in seq if predicate is None or predicate(x)))
+    return seq[0] if predicate is None and isinstance(seq, Sequence) else next((x for x in seq if predicate is None or predicate(x)))
 
 def first_or_default(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, default: Optional[T] = None) -> Optional[T]:
-    return seq[0] if not predicate and isinstance(seq, Sequence) else next((x for x in seq if predicate is None or predicate(x)), default)
+    return (seq[0] if seq else default) if predicate is None and isinstance(seq, Sequence) else next((x for x in seq if predicate is None or predicate(x)), default)
 
 def last(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None) -> T:
-    result = None
-    for item in seq:
-        if predicate is None or predicate(item):
-            result = item
-    if result is None:
-        raise ValueError("No matching element found")
-    return result
+    return _found(_last(seq, predicate))
 
 def last_or_default(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, default: Optional[T] = None) -> Optional[T]:
-    result = default
-    for item in seq:
-        if predicate is None or predicate(item):
-            result = item
-    return result
+    result = _last(seq, predicate)
+    return default if result is _MISSING else result
 
 def take(seq: Iterable[T], n: int) -> Iterable[T]:
+    if isinstance(seq, _SLICEABLE) and n >= 0:
+        return seq[:n]
     return islice(seq, n)
 
 def take_last(seq: Iterable[T], n: int) -> Iterable[T]:
-    return skip(seq, count(seq) - n)
+    if n <= 0:
+        return []
+    if isinstance(seq, _SLICEABLE):
+        return seq[max(len(seq) - n, 0):]
+    return deque(seq, maxlen=n)
 
 def skip(seq: Iterable[T], n: int) -> Iterable[T]:
+    if isinstance(seq, _SLICEABLE) and n >= 0:
+        return seq[n:]
     return islice(seq, n, None)
 
 def skip_last(seq: Iterable[T], n: int) -> Iterable[T]:
-    return seq if not n else take(seq, count(seq) - n)
+    if n <= 0:
+        return seq
+    if isinstance(seq, _SLICEABLE):
+        return seq[:max(len(seq) - n, 0)]
+    return _skip_last(seq, n)
 
 
 # FILTER & TRANSFORM
@@ -125,33 +222,189 @@ def where(seq: Iterable[T], predicate: Callable[[T], bool]) -> Iterable[T]:
 def select(seq: Iterable[T], selector: Callable[[T], U]) -> Iterable[U]:
     return (selector(x) for x in seq)
 
+def select_concurrent(seq: Iterable[T], selector: Callable[[T], U], max_workers: Optional[int] = None, max_in_flight: Optional[int] = None, ordered: bool = True) -> Iterable[U]:
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield from _bounded_map(executor, selector, ((x,) for x in seq), max_in_flight or max_workers * 2, ordered)
+    finally:
+        executor.shutdown(wait=False)
+
 def select_many(seq: Iterable[T], key_selector: Callable[[T], K]) -> Iterable[U]:
     for x in seq:
         yield from key_selector(x)
 
-def with_min(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Iterable[T]:
-    return _with_min_small(seq, predicate, key_selector) if sum(1 for _ in islice(seq, 1269)) < 1269 else _with_min_large(seq, predicate, key_selector)
+def with_min(seq: Iterable[T], predicate: Optional[Callable[[K], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> List[T]:
+    return _with_extreme(seq, predicate, key_selector, operator.lt)
+
+def with_max(seq: Iterable[T], predicate: Optional[Callable[[K], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> List[T]:
+    return _with_extreme(seq, predicate, key_selector, operator.gt)
+
+def min_by(seq: Iterable[T], key_selector: Callable[[T], K]) -> T:
+    return _found(min(seq, key=key_selector, default=_MISSING))
+
+def max_by(seq: Iterable[T], key_selector: Callable[[T], K]) -> T:
+    return _found(max(seq, key=key_selector, default=_MISSING))
+
+def min_max_by(seq: Iterable[T], key_selector: Callable[[T], K]) -> Tuple[T, T]:
+    it = iter(seq)
+    lo_item = hi_item = _found(next(it, _MISSING))
+    lo = hi = key_selector(lo_item)
+    for item in it:
+        key = key_selector(item)
+        if key < lo:
+            lo, lo_item = key, item
+        elif key > hi:
+            hi, hi_item = key, item
+    return lo_item, hi_item
+
+def order_by(seq: Iterable[T], key_selector: Callable[[T], Any], memory_limit: Optional[int] = None) -> Iterable[T]:
+    return order_by_keys(seq, ((key_selector, False),), memory_limit)
+
+def order_by_desc(seq: Iterable[T], key_selector: Callable[[T], Any], memory_limit: Optional[int] = None) -> Iterable[T]:
+    return order_by_keys(seq, ((key_selector, True),), memory_limit)
+
+def order_by_keys(seq: Iterable[T], keys: Sequence[Tuple[Callable[[T], Any], bool]], memory_limit: Optional[int] = None) -> Iterable[T]:
+    key_selector, reverse = _composite_key(keys)
+    if memory_limit is None:
+        return sorted(seq, key=key_selector, reverse=reverse)
+    if memory_limit < 1:
+        raise ValueError("memory_limit must be positive")
+    return _external_sort(seq, key_selector, reverse, memory_limit)
 
-def with_max(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Iterable[T]:
-    return _with_max_small(seq, predicate, key_selector) if sum(1 for _ in islice(seq, 1269)) < 1269 else _with_max_large(seq, predicate, key_selector)
+def take_ordered_keys(seq: Iterable[T], n: int, keys: Sequence[Tuple[Callable[[T], Any], bool]]) -> List[T]:
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+    key_selector, reverse = _composite_key(keys)
+    return heapq.nlargest(n, seq, key=key_selector) if reverse else heapq.nsmallest(n, seq, key=key_selector)
 
-def order_by(seq: Iterable[T], key_selector: Callable[[T], Any]) -> Iterable[T]:
-    return sorted(seq, key=key_selector)
+def take_ordered(seq: Iterable[T], n: int, key_selector: Callable[[T], Any]) -> List[T]:
+    return heapq.nsmallest(n, seq, key=key_selector)
 
-def order_by_desc(seq: Iterable[T], key_selector: Callable[[T], Any]) -> Iterable[T]:
-    return sorted(seq, key=key_selector, reverse=True)
+def take_ordered_desc(seq: Iterable[T], n: int, key_selector: Callable[[T], Any]) -> List[T]:
+    return heapq.nlargest(n, seq, key=key_selector)
 
 
 # ADVANCED
 
-def group_by(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> Iterable[Tuple[K, Iterable[U]]]:
-    groups: defaultdict[K, list[U]] = defaultdict(list)
+def group_by(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None, presorted: bool = False, memory_limit: Optional[int] = None) -> Iterable[Tuple[K, Iterable[U]]]:
+    if presorted:
+        return group_adjacent(seq, key_selector, value_selector)
+    if memory_limit is not None:
+        if memory_limit < 1:
+            raise ValueError("memory_limit must be positive")
+        return _group_spilling(seq, key_selector, value_selector, memory_limit)
+    return _group_all(seq, key_selector, value_selector)
+
+def group_adjacent(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> Iterable[Tuple[K, List[U]]]:
+    for key, items in groupby(seq, key_selector):
+        yield key, list(items if value_selector is None else map(value_selector, items))
+
+def group_by_compact(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> PynGroupIndex[K, U]:
+    values: Any = seq if value_selector is None and isinstance(seq, (list, tuple)) else []
+    append = None if values is seq else values.append
+    ids: Dict[K, int] = {}
+    keys: List[K] = []
+    group_ids = array('q')
     for item in seq:
         key = key_selector(item)
-        value = value_selector(item) if value_selector else item
-        groups[key].append(value)
-    for key, values in groups.items():
-        yield key, values
+        i = ids.get(key)
+        if i is None:
+            i = ids[key] = len(keys)
+            keys.append(key)
+        group_ids.append(i)
+        if append is not None:
+            append(value_selector(item) if value_selector is not None else item)
+    del ids
+    typecode = 'i' if len(group_ids) < 2 ** 31 else 'q'
+    offsets = array(typecode, bytes(array(typecode).itemsize * (len(keys) + 1)))
+    for i in group_ids:
+        offsets[i + 1] += 1
+    for i in range(len(keys)):
+        offsets[i + 1] += offsets[i]
+    cursor = offsets[:-1]
+    order = array(typecode, bytes(offsets.itemsize * len(group_ids)))
+    for position, i in enumerate(group_ids):
+        order[cursor[i]] = position
+        cursor[i] += 1
+    return PynGroupIndex(keys, values, offsets, order)
+
+def group_aggregate(seq: Iterable[T], key_selector: Callable[[T], K], **aggregates: Any) -> Iterable[Tuple[K, Dict[str, Any]]]:
+    names = tuple(aggregates)
+    accumulators = tuple(_accumulator(spec) for spec in aggregates.values())
+    seeds = tuple(seed for seed, _, _ in accumulators)
+    steps = tuple(step for _, step, _ in accumulators)
+    states: Dict[K, List[Any]] = {}
+    for item in seq:
+        key = key_selector(item)
+        state = states.get(key)
+        if state is None:
+            state = states[key] = [seed() for seed in seeds]
+        for i, step in enumerate(steps):
+            state[i] = step(state[i], item)
+    for key, state in states.items():
+        yield key, {name: finish(value) for name, (_, _, finish), value in zip(names, accumulators, state)}
+
+def join(seq: Iterable[T], inner: Iterable[U], outer_key_selector: Union[Callable[[T], K], Sequence[Callable[[T], Any]]], inner_key_selector: Union[Callable[[U], K], Sequence[Callable[[U], Any]]], result_selector: Optional[Callable[[T, U], Any]] = None, build: Optional[str] = None) -> Iterable[Any]:
+    outer_key, inner_key = _key_of(outer_key_selector), _key_of(inner_key_selector)
+    result_selector = _pair if result_selector is None else result_selector
+    if _build_outer(seq, inner, build):
+        lookup = to_lookup(seq, outer_key)
+        for i in inner:
+            for o in lookup.get(inner_key(i), ()):
+                yield result_selector(o, i)
+    else:
+        lookup = to_lookup(inner, inner_key)
+        for o in seq:
+            for i in lookup.get(outer_key(o), ()):
+                yield result_selector(o, i)
+
+def left_join(seq: Iterable[T], inner: Iterable[U], outer_key_selector: Union[Callable[[T], K], Sequence[Callable[[T], Any]]], inner_key_selector: Union[Callable[[U], K], Sequence[Callable[[U], Any]]], result_selector: Optional[Callable[[T, Optional[U]], Any]] = None, default: Optional[U] = None, build: Optional[str] = None) -> Iterable[Any]:
+    outer_key, inner_key = _key_of(outer_key_selector), _key_of(inner_key_selector)
+    result_selector = _pair if result_selector is None else result_selector
+    if _build_outer(seq, inner, build or 'inner'):
+        keyed = [(outer_key(o), o) for o in seq]
+        lookup: Dict[K, List[T]] = {}
+        for key, o in keyed:
+            lookup.setdefault(key, []).append(o)
+        matched = set()
+        for i in inner:
+            key = inner_key(i)
+            for o in lookup.get(key, ()):
+                matched.add(key)
+                yield result_selector(o, i)
+        for key, o in keyed:
+            if key not in matched:
+                yield result_selector(o, default)
+    else:
+        lookup = to_lookup(inner, inner_key)
+        for o in seq:
+            matches = lookup.get(outer_key(o))
+            if not matches:
+                yield result_selector(o, default)
+                continue
+            for i in matches:
+                yield result_selector(o, i)
+
+def group_join(seq: Iterable[T], inner: Iterable[U], outer_key_selector: Union[Callable[[T], K], Sequence[Callable[[T], Any]]], inner_key_selector: Union[Callable[[U], K], Sequence[Callable[[U], Any]]], result_selector: Optional[Callable[[T, List[U]], Any]] = None) -> Iterable[Any]:
+    outer_key, inner_key = _key_of(outer_key_selector), _key_of(inner_key_selector)
+    result_selector = _pair if result_selector is None else result_selector
+    lookup = to_lookup(inner, inner_key)
+    for o in seq:
+        yield result_selector(o, lookup.get(outer_key(o), []))
+
+def chunk(seq: Iterable[T], size: int) -> Iterable[Sequence[T]]:
+    if size < 1:
+        raise ValueError("Chunk size must be positive")
+    if isinstance(seq, (range, memoryview)) or is_ndarray(seq):
+        return (seq[i:i + size] for i in range(0, len(seq), size))
+    if isinstance(seq, Sequence) and not isinstance(seq, (str, bytes)):
+        return (_SliceView(seq, i, min(i + size, len(seq))) for i in range(0, len(seq), size))
+    return _chunk_iter(seq, size)
+
+def batch_select(seq: Iterable[T], selector: Callable[[Sequence[T]], Iterable[U]], size: int) -> Iterable[U]:
+    for batch in chunk(seq, size):
+        yield from selector(batch)
 
 def concatenate(*seqs: Iterable[T]) -> Iterable[T]:
     for seq in seqs:
@@ -174,49 +427,354 @@ def aggregate(seq: Iterable[T], func: Callable[[U, T], U], seed: Optional[U] = N
 # PRIVATE
 
 def _ensure_selector(key_selector: Callable[[T], K]) -> Callable[[T], K]:
-    return key_selector if key_selector else lambda value: value
+    return compiled(key_selector) if key_selector is not None else lambda value: value
 
 def _filter(seq: Iterable[T], predicate: Callable[[T], bool], key_selector: Callable[[T], K]) -> Iterable[T]:
-    key_selector = _ensure_selector(key_selector)
-    return (key_selector(x) for x in seq if predicate is None or predicate(key_selector(x)))
+    values = seq if key_selector is None else map(compiled(key_selector), seq)
+    return values if predicate is None else filter(compiled(predicate), values)
 
-def _with_min_large(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Iterable[T]:
-    key_selector = _ensure_selector(key_selector)
-    filtered = _filter(seq, predicate)
-    cur = next(filtered, None)
-    items_with = []
-    if cur:
-        for x in filtered:
-            if key_selector(x) > key_selector(cur):
-                continue
-            if key_selector(x) < key_selector(cur):
-                cur = x
-                items_with = []
-            items_with.append(cur)
-    return items_with
+def _group_all(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]]) -> Iterable[Tuple[K, List[U]]]:
+    groups: defaultdict[K, list[U]] = defaultdict(list)
+    for item in seq:
+        key = key_selector(item)
+        value = value_selector(item) if value_selector is not None else item
+        groups[key].append(value)
+    for key, values in groups.items():
+        yield key, values
 
-def _with_min_small(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Iterable[T]:
-    key_selector = _ensure_selector(key_selector)
-    return _filter(_filter(seq, predicate), lambda x: key_selector(x) == min_of(seq, predicate, key_selector))
+def _accumulator(spec: Any) -> Tuple[Callable[[], Any], Callable[[Any, T], Any], Callable[[Any], Any]]:
+    if isinstance(spec, str) or callable(spec):
+        spec = (spec,)
+    op, selector, seed = (tuple(spec) + (None, None))[:3]
+    selector = _ensure_selector(selector)
+    if callable(op) and seed is None:
+        return (lambda: _MISSING), (lambda acc, item: selector(item) if acc is _MISSING else op(acc, selector(item))), _or_none
+    if callable(op):
+        return (lambda: seed), (lambda acc, item: op(acc, selector(item))), _identity
+    if op == 'count':
+        return (lambda: 0), (lambda acc, item: acc + 1), _identity
+    if op == 'sum':
+        return (lambda: 0), (lambda acc, item: acc + selector(item)), _identity
+    if op == 'min':
+        return (lambda: _MISSING), (lambda acc, item: _lesser(acc, selector(item))), _or_none
+    if op == 'max':
+        return (lambda: _MISSING), (lambda acc, item: _greater(acc, selector(item))), _or_none
+    if op in ('mean', 'avg'):
+        return (lambda: (0, 0)), (lambda acc, item: (acc[0] + selector(item), acc[1] + 1)), (lambda acc: acc[0] / acc[1] if acc[1] else None)
+    if op in ('variance', 'stddev'):
+        finish = _variance if op == 'variance' else (lambda acc: None if acc[0] == 0 else _sqrt(_variance(acc)))
+        return (lambda: (0, None, None)), (lambda acc, item: _welford(acc, selector(item))), finish
+    raise ValueError(f"Unknown aggregate: {op!r}")
+
+def _welford(acc: Tuple[int, Any, Any], value: Any) -> Tuple[int, Any, Any]:
+    n, mean, m2 = acc
+    if not n:
+        return 1, value, value - value
+    n += 1
+    delta = value - mean
+    mean += delta / n
+    return n, mean, m2 + delta * (value - mean)
+
+def _variance(acc: Tuple[int, Any, Any]) -> Any:
+    return acc[2] / acc[0] if acc[0] else None
+
+def _sqrt(value: Any) -> Any:
+    return value.sqrt() if isinstance(value, Decimal) else math.sqrt(value)
+
+def _constant_key(item: Any) -> None:
+    return None
+
+def _array_stats(arr: Any, ddof: int) -> PynStats:
+    n = int(arr.size)
+    if not n:
+        return PynStats(0, 0, None, None, None, None, None)
+    total = reduce_sum(arr)
+    variance = float(arr.var(ddof=ddof)) if n > ddof else None
+    return PynStats(n, total, arr.min().item(), arr.max().item(), total / n, variance, math.sqrt(variance) if variance is not None else None)
+
+def _identity(value: T) -> T:
+    return value
+
+def _or_none(value: Any) -> Any:
+    return None if value is _MISSING else value
+
+def _lesser(acc: Any, value: Any) -> Any:
+    return value if acc is _MISSING or value < acc else acc
+
+def _greater(acc: Any, value: Any) -> Any:
+    return value if acc is _MISSING or value > acc else acc
+
+_SPILL_MAX_DEPTH = 8
+
+def _group_spilling(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]], memory_limit: int) -> Iterable[Tuple[K, List[U]]]:
+    it = iter(seq)
+    groups: Dict[K, List[U]] = {}
+    buffered = 0
+    for item in it:
+        key = key_selector(item)
+        groups.setdefault(key, []).append(value_selector(item) if value_selector is not None else item)
+        buffered += 1
+        if buffered > memory_limit:
+            break
+    else:
+        yield from groups.items()
+        return
+    buffered_pairs = ((key, value) for key, values in groups.items() for value in values)
+    rest = ((key_selector(item), value_selector(item) if value_selector is not None else item) for item in it)
+    run = tempfile.TemporaryFile()
+    try:
+        spilled = _spill_pairs(run, chain(buffered_pairs, rest), memory_limit)
+        groups = {}
+        yield from _group_partition(run, spilled, memory_limit, 0)
+    finally:
+        run.close()
+
+def _spill_pairs(f: Any, pairs: Iterable[Tuple[K, U]], block: int) -> int:
+    pending: List[Tuple[K, U]] = []
+    count = 0
+    for pair in pairs:
+        pending.append(pair)
+        count += 1
+        if len(pending) >= block:
+            pickle.dump(pending, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pending = []
+    if pending:
+        pickle.dump(pending, f, protocol=pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return count
+
+def _group_partition(f: Any, count: int, memory_limit: int, depth: int) -> Iterable[Tuple[K, List[U]]]:
+    if count <= memory_limit or depth >= _SPILL_MAX_DEPTH:
+        yield from _group_unspilled(f)
+        return
+    n = max(2, -(-count // memory_limit))
+    block = max(1, memory_limit // n)
+    partitions = [tempfile.TemporaryFile() for _ in range(n)]
+    try:
+        pending: List[List[Tuple[K, U]]] = [[] for _ in partitions]
+        counts = [0] * n
+        for key, value in _unspill(f):
+            i = hash((depth, key)) % n
+            pending[i].append((key, value))
+            counts[i] += 1
+            if len(pending[i]) >= block:
+                pickle.dump(pending[i], partitions[i], protocol=pickle.HIGHEST_PROTOCOL)
+                pending[i] = []
+        if max(counts) == count:
+            # every key landed in one partition (a single key or colliding hashes), splitting again cannot help
+            for part in partitions:
+                part.close()
+            pending = []
+            f.seek(0)
+            yield from _group_unspilled(f)
+            return
+        for i, part in enumerate(partitions):
+            if pending[i]:
+                pickle.dump(pending[i], part, protocol=pickle.HIGHEST_PROTOCOL)
+            part.seek(0)
+        pending = []
+        for part, part_count in zip(partitions, counts):
+            yield from _group_partition(part, part_count, memory_limit, depth + 1)
+            part.close()
+    finally:
+        for part in partitions:
+            part.close()
+
+def _group_unspilled(f: Any) -> Iterable[Tuple[K, List[U]]]:
+    groups: Dict[K, List[U]] = {}
+    for key, value in _unspill(f):
+        groups.setdefault(key, []).append(value)
+    yield from groups.items()
+
+def _pair(left: T, right: U) -> Tuple[T, U]:
+    return left, right
+
+def _key_of(key_selector: Union[Callable[[T], K], Sequence[Callable[[T], Any]]]) -> Callable[[T], Any]:
+    if callable(key_selector):
+        return key_selector
+    selectors = tuple(key_selector)
+    return lambda x: tuple([key(x) for key in selectors])
+
+def _build_outer(seq: Iterable[Any], inner: Iterable[Any], build: Optional[str]) -> bool:
+    if build not in (None, 'inner', 'outer'):
+        raise ValueError("build must be 'inner', 'outer' or None")
+    if build is None:
+        return isinstance(seq, Sized) and isinstance(inner, Sized) and len(seq) < len(inner)
+    return build == 'outer'
+
+class _Desc:
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: '_Desc') -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Desc) and self.value == other.value
+
+def _composite_key(keys: Sequence[Tuple[Callable[[T], Any], bool]]) -> Tuple[Callable[[T], Any], bool]:
+    if len(keys) == 1:
+        return keys[0]
+    selectors = tuple(key for key, _ in keys)
+    directions = set(desc for _, desc in keys)
+    if len(directions) == 1:
+        return (lambda x: tuple([key(x) for key in selectors])), directions.pop()
+    return (lambda x: tuple([_Desc(key(x)) if desc else key(x) for key, desc in keys])), False
+
+_SPILL_BLOCK = 4096
+
+def _external_sort(seq: Iterable[T], key_selector: Callable[[T], Any], reverse: bool, memory_limit: int) -> Iterable[T]:
+    it = iter(seq)
+    runs: List[Any] = []
+    try:
+        while True:
+            run = [(key_selector(x), x) for x in islice(it, memory_limit)]
+            run.sort(key=_first_item, reverse=reverse)
+            if len(run) < memory_limit and not runs:
+                yield from (x for _, x in run)
+                return
+            if run:
+                runs.append(_spill(run))
+            if len(run) < memory_limit:
+                break
+        merged = heapq.merge(*(_unspill(f) for f in runs), key=_first_item, reverse=reverse)
+        for _, x in merged:
+            yield x
+    finally:
+        for f in runs:
+            f.close()
+
+def _first_item(pair: Tuple[Any, Any]) -> Any:
+    return pair[0]
+
+def _spill(run: List[Any]) -> Any:
+    f = tempfile.TemporaryFile()
+    for i in range(0, len(run), _SPILL_BLOCK):
+        pickle.dump(run[i:i + _SPILL_BLOCK], f, protocol=pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+def _unspill(f: Any) -> Iterable[Any]:
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+        yield from block
+
+def _bounded_map(executor: Executor, func: Callable[..., U], args: Iterable[Tuple[Any, ...]], in_flight: int, ordered: bool) -> Iterable[U]:
+    args = iter(args)
+    pending: deque = deque(executor.submit(func, *a) for a in islice(args, max(in_flight, 1)))
+    try:
+        while pending:
+            if ordered:
+                done = pending.popleft()
+            else:
+                done = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(done)
+            for a in islice(args, 1):
+                pending.append(executor.submit(func, *a))
+            yield done.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def _chunk_iter(seq: Iterable[T], size: int) -> Iterable[List[T]]:
+    it = iter(seq)
+    batch = list(islice(it, size))
+    while batch:
+        yield batch
+        batch = list(islice(it, size))
 
-def _with_max_large(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Iterable[T]:
-    key_selector = _ensure_selector(key_selector)
-    filtered = _filter(seq, predicate)
-    cur = next(filtered, None)
-    items_with = []
-    if cur:
-        for x in filtered:
-            if key_selector(x) < key_selector(cur):
-                continue
-            if key_selector(x) > key_selector(cur):
-                cur = x
-                items_with = []
-            items_with.append(cur)
-    return items_with
+class _SliceView(Sequence):
+    __slots__ = ('_seq', '_start', '_stop')
+
+    def __init__(self, seq: Sequence[T], start: int, stop: int):
+        self._seq = seq
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+        return self._seq[self._start + index]
+
+    def __iter__(self) -> Iterable[T]:
+        return map(self._seq.__getitem__, range(self._start, self._stop))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Sequence) and len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"_SliceView({list(self)!r})"
+
+class _MappedView(Sequence):
+    __slots__ = ('_seq', '_selector')
+
+    def __init__(self, seq: Sequence[T], selector: Callable[[T], U]):
+        self._seq = seq
+        self._selector = selector
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return _MappedView(self._seq[index], self._selector)
+        return self._selector(self._seq[index])
+
+    def __iter__(self) -> Iterator[U]:
+        return map(self._selector, self._seq)
 
-def _with_max_small(seq: Iterable[T], predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Iterable[T]:
+    def __reversed__(self) -> Iterator[U]:
+        return map(self._selector, reversed(self._seq))
+
+_SLICEABLE = (list, tuple, range, _MappedView)
+
+def _last(seq: Iterable[T], predicate: Optional[Callable[[T], bool]]) -> Any:
+    if isinstance(seq, Reversible):
+        return next((x for x in reversed(seq) if predicate is None or predicate(x)), _MISSING)
+    result: Any = _MISSING
+    for item in seq:
+        if predicate is None or predicate(item):
+            result = item
+    return result
+
+def _skip_last(seq: Iterable[T], n: int) -> Iterable[T]:
+    buffer: deque = deque()
+    for item in seq:
+        buffer.append(item)
+        if len(buffer) > n:
+            yield buffer.popleft()
+
+def _found(item: Any) -> Any:
+    if item is _MISSING:
+        raise ValueError("No matching element found")
+    return item
+
+def _with_extreme(seq: Iterable[T], predicate: Optional[Callable[[K], bool]], key_selector: Optional[Callable[[T], K]], better: Callable[[K, K], bool]) -> List[T]:
     key_selector = _ensure_selector(key_selector)
-    return _filter(_filter(seq, predicate), lambda x: key_selector(x) == max_of(seq, predicate, key_selector))
+    items: List[T] = []
+    best = None
+    for item in seq:
+        key = key_selector(item)
+        if predicate is not None and not predicate(key):
+            continue
+        if not items or better(key, best):
+            best = key
+            items = [item]
+        elif not better(best, key):
+            items.append(item)
+    return items
 
 
 if __name__ == '__main__':
@@ -0,0 +1,88 @@
+# pynq/numeric.py
+from typing import Iterable, Optional
+from typing import Any, TypeVar
+from array import array
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# FOOL OF A ...
+T = TypeVar('T')
+
+_MISSING = object()
+_INT64_MAX = 2 ** 63 - 1
+
+
+def has_numpy() -> bool:
+    return np is not None
+
+def is_ndarray(seq: Any) -> bool:
+    return np is not None and isinstance(seq, np.ndarray)
+
+def as_array(seq: Iterable[T]) -> Optional['np.ndarray']:
+    if np is None:
+        return None
+    if isinstance(seq, (np.ndarray, array, memoryview)):
+        arr = np.asarray(seq)
+        return arr if arr.ndim == 1 and arr.dtype.kind in 'biuf' else None
+    return None
+
+def reduce_sum(values: Iterable[T]) -> Any:
+    arr = as_array(values)
+    if arr is not None:
+        return _array_sum(arr)
+    it = iter(values)
+    first = next(it, _MISSING)
+    if first is _MISSING:
+        return 0
+    return _scalar(sum(it, first))
+
+def reduce_avg(values: Iterable[T]) -> Optional[float]:
+    arr = as_array(values)
+    if arr is not None:
+        return float(_array_sum(arr)) / arr.size if arr.size else None
+    it = iter(values)
+    first = next(it, _MISSING)
+    if first is _MISSING:
+        return None
+    total, items = first, 1
+    for x in it:
+        total += x
+        items += 1
+    return _scalar(total / items)
+
+def reduce_min(values: Iterable[T]) -> Optional[T]:
+    arr = as_array(values)
+    if arr is not None:
+        return arr.min().item() if arr.size else None
+    return _scalar(min(values, default=None))
+
+def reduce_max(values: Iterable[T]) -> Optional[T]:
+    arr = as_array(values)
+    if arr is not None:
+        return arr.max().item() if arr.size else None
+    return _scalar(max(values, default=None))
+
+
+# PRIVATE
+
+def _scalar(value: Any) -> Any:
+    return value.item() if np is not None and isinstance(value, np.generic) else value
+
+def _array_sum(arr: 'np.ndarray') -> Any:
+    if not arr.size:
+        return 0
+    kind = arr.dtype.kind
+    if kind == 'f':
+        return float(arr.sum())
+    if kind == 'b':
+        return int(arr.sum())
+    if max(-int(arr.min()), int(arr.max())) <= _INT64_MAX // arr.size:
+        return int(arr.sum(dtype=np.int64 if kind == 'i' else np.uint64))
+    return sum(arr.tolist())
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.numeric!')
@@ -0,0 +1,276 @@
+# pynq/pynasync.py
+from typing import Generic, Callable, Iterable, AsyncIterable, Optional
+from typing import Any, Dict, List, Tuple, Union, AsyncIterator, TypeVar
+from collections import deque
+import asyncio
+import inspect
+from operator import itemgetter
+from .pyngrouping import PynGrouping
+
+
+# FOOL OF A ...
+T = TypeVar('T')
+U = TypeVar('U')
+K = TypeVar('K')
+
+_MISSING = object()
+
+
+class AsyncPynQuery(Generic[T]):
+
+    def __init__(self, iterable: Union[AsyncIterable[T], Iterable[T]], stages: Tuple[Tuple[Callable[..., AsyncIterator[Any]], Tuple[Any, ...]], ...] = ()):
+        self._source = iterable
+        self._stages = tuple(stages)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        seq = _from_iterable(self._source)
+        for func, args in self._stages:
+            seq = func(seq, *args)
+        return seq.__aiter__()
+
+    def _then(self, func: Callable[..., AsyncIterator[Any]], *args: Any) -> 'AsyncPynQuery':
+        return AsyncPynQuery(self._source, self._stages + ((func, args),))
+
+    # BASIC
+
+    async def to_list(self) -> List[T]:
+        return [x async for x in self]
+
+    async def any(self) -> bool:
+        return await self.first_or_default(None, _MISSING) is not _MISSING
+
+    async def has(self, predicate: Optional[Callable[[T], Any]] = None) -> bool:
+        return await self.first_or_default(bool if predicate is None else predicate, _MISSING) is not _MISSING
+
+    async def count(self, predicate: Optional[Callable[[T], Any]] = None) -> int:
+        query = self.where(predicate) if predicate is not None else self
+        items = 0
+        async for _ in query:
+            items += 1
+        return items
+
+    async def sum(self, predicate: Optional[Callable[[T], Any]] = None, key_selector: Optional[Callable[[T], K]] = None) -> T:
+        total = 0
+        async for x in self._values(predicate, key_selector):
+            total += x
+        return total
+
+    async def avg(self, predicate: Optional[Callable[[T], Any]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Optional[float]:
+        total, items = 0, 0
+        async for x in self._values(predicate, key_selector):
+            total += x
+            items += 1
+        return total / items if items else None
+
+    async def min(self, predicate: Optional[Callable[[T], Any]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Optional[T]:
+        cur = _MISSING
+        async for x in self._values(predicate, key_selector):
+            if cur is _MISSING or x < cur:
+                cur = x
+        return None if cur is _MISSING else cur
+
+    async def max(self, predicate: Optional[Callable[[T], Any]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Optional[T]:
+        cur = _MISSING
+        async for x in self._values(predicate, key_selector):
+            if cur is _MISSING or x > cur:
+                cur = x
+        return None if cur is _MISSING else cur
+
+    async def contains(self, item: T) -> bool:
+        return await self.has(lambda x: x == item)
+
+    async def first(self, predicate: Optional[Callable[[T], Any]] = None) -> T:
+        result = await self.first_or_default(predicate, _MISSING)
+        if result is _MISSING:
+            raise ValueError("No matching element found")
+        return result
+
+    async def first_or_default(self, predicate: Optional[Callable[[T], Any]] = None, default: Optional[T] = None) -> Optional[T]:
+        query = self.where(predicate) if predicate is not None else self
+        it = query.__aiter__()
+        try:
+            return await it.__anext__()
+        except StopAsyncIteration:
+            return default
+        finally:
+            await _close(it)
+
+    async def last(self, predicate: Optional[Callable[[T], Any]] = None) -> T:
+        result = await self.last_or_default(predicate, _MISSING)
+        if result is _MISSING:
+            raise ValueError("No matching element found")
+        return result
+
+    async def last_or_default(self, predicate: Optional[Callable[[T], Any]] = None, default: Optional[T] = None) -> Optional[T]:
+        result = default
+        async for x in (self.where(predicate) if predicate is not None else self):
+            result = x
+        return result
+
+    def distinct(self) -> 'AsyncPynQuery[T]':
+        return self._then(_distinct)
+
+    def take(self, n: int) -> 'AsyncPynQuery[T]':
+        return self._then(_take, n)
+
+    def skip(self, n: int) -> 'AsyncPynQuery[T]':
+        return self._then(_skip, n)
+
+    # FILTER & TRANSFORM
+
+    def where(self, predicate: Callable[[T], Any]) -> 'AsyncPynQuery[T]':
+        return self._then(_where, predicate)
+
+    def select(self, selector: Callable[[T], U], concurrency: Optional[int] = None) -> 'AsyncPynQuery[U]':
+        if concurrency and concurrency > 1:
+            return self._then(_select_concurrent, selector, concurrency)
+        return self._then(_select, selector)
+
+    def select_many(self, key_selector: Callable[[T], Any]) -> 'AsyncPynQuery[U]':
+        return self._then(_select_many, key_selector)
+
+    # ADVANCED
+
+    def order_by(self, key_selector: Callable[[T], Any]) -> 'AsyncPynQuery[T]':
+        return self._then(_order_by, key_selector, False)
+
+    def order_by_desc(self, key_selector: Callable[[T], Any]) -> 'AsyncPynQuery[T]':
+        return self._then(_order_by, key_selector, True)
+
+    def group_by(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> 'AsyncPynQuery[PynGrouping[K, U]]':
+        return self._then(_group_by, key_selector, value_selector)
+
+    async def aggregate(self, func: Callable[[U, T], U], seed: Optional[U] = None) -> U:
+        result: Any = _MISSING if seed is None else seed
+        async for x in self:
+            if result is _MISSING:
+                result = x
+                continue
+            result = await _call(func, result, x)
+        if result is _MISSING:
+            raise TypeError("Cannot aggregate empty sequence without seed")
+        return result
+
+    def concatenate(self, *seqs: Union[AsyncIterable[T], Iterable[T]]) -> 'AsyncPynQuery[T]':
+        return self._then(_concatenate, seqs)
+
+    def _values(self, predicate: Optional[Callable[[Any], Any]], key_selector: Optional[Callable[[T], K]]) -> 'AsyncPynQuery[Any]':
+        query = self.select(key_selector) if key_selector is not None else self
+        return query.where(predicate) if predicate is not None else query
+
+    # ALIASES
+    toList = to_list
+    selectMany = select_many
+    firstOrDefault = first_or_default
+    lastOrDefault = last_or_default
+    orderByDesc = order_by_desc
+    orderBy = order_by
+    groupBy = group_by
+
+
+# PRIVATE
+
+async def _call(func: Callable[..., Any], *args: Any) -> Any:
+    result = func(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+async def _from_iterable(seq: Union[AsyncIterable[T], Iterable[T]]) -> AsyncIterator[T]:
+    if isinstance(seq, AsyncIterable):
+        async for x in seq:
+            yield x
+    else:
+        for x in seq:
+            yield x
+
+async def _where(seq: AsyncIterable[T], predicate: Callable[[T], Any]) -> AsyncIterator[T]:
+    async for x in seq:
+        if await _call(predicate, x):
+            yield x
+
+async def _select(seq: AsyncIterable[T], selector: Callable[[T], U]) -> AsyncIterator[U]:
+    async for x in seq:
+        yield await _call(selector, x)
+
+async def _select_concurrent(seq: AsyncIterable[T], selector: Callable[[T], U], limit: int) -> AsyncIterator[U]:
+    it = seq.__aiter__()
+    pending: deque = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = await it.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.append(asyncio.ensure_future(_call(selector, item)))
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def _select_many(seq: AsyncIterable[T], key_selector: Callable[[T], Any]) -> AsyncIterator[U]:
+    async for x in seq:
+        async for y in _from_iterable(await _call(key_selector, x)):
+            yield y
+
+async def _distinct(seq: AsyncIterable[T]) -> AsyncIterator[T]:
+    seen = set()
+    async for x in seq:
+        if x not in seen:
+            seen.add(x)
+            yield x
+
+async def _take(seq: AsyncIterable[T], n: int) -> AsyncIterator[T]:
+    it = seq.__aiter__()
+    try:
+        while n > 0:
+            try:
+                x = await it.__anext__()
+            except StopAsyncIteration:
+                return
+            yield x
+            n -= 1
+    finally:
+        await _close(it)
+
+async def _close(it: AsyncIterator[Any]) -> None:
+    aclose = getattr(it, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+
+async def _skip(seq: AsyncIterable[T], n: int) -> AsyncIterator[T]:
+    async for x in seq:
+        if n > 0:
+            n -= 1
+            continue
+        yield x
+
+async def _order_by(seq: AsyncIterable[T], key_selector: Callable[[T], Any], descending: bool) -> AsyncIterator[T]:
+    decorated = [(await _call(key_selector, x), x) async for x in seq]
+    decorated.sort(key=itemgetter(0), reverse=descending)
+    for _, x in decorated:
+        yield x
+
+async def _group_by(seq: AsyncIterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]]) -> AsyncIterator[PynGrouping[K, U]]:
+    groups: Dict[K, List[Any]] = {}
+    async for x in seq:
+        key = await _call(key_selector, x)
+        groups.setdefault(key, []).append(await _call(value_selector, x) if value_selector is not None else x)
+    for key, values in groups.items():
+        yield PynGrouping(key, values)
+
+async def _concatenate(seq: AsyncIterable[T], seqs: Tuple[Union[AsyncIterable[T], Iterable[T]], ...]) -> AsyncIterator[T]:
+    async for x in seq:
+        yield x
+    for other in seqs:
+        async for x in _from_iterable(other):
+            yield x
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.AsyncPynQuery!')
@@ -0,0 +1,299 @@
+# pynq/pynexpr.py
+from typing import Callable, Iterable, Optional
+from typing import Any, Dict, FrozenSet, Tuple
+from operator import itemgetter, attrgetter
+import keyword
+import math
+
+
+class _Attr:
+
+    def __get__(self, expr: Optional['PynExpr'], owner: type) -> Callable[[str], 'PynExpr']:
+        base = expr if expr is not None else PynExpr('this')
+        return lambda name: PynExpr('attr', base, name)
+
+
+class PynExpr:
+    __slots__ = ('op', 'args', '_fn')
+
+    def __init__(self, op: str, *args: Any):
+        self.op = op
+        self.args = args
+        self._fn: Optional[Callable[[Any], Any]] = None
+
+    def __call__(self, item: Any) -> Any:
+        return (self._fn or self.compile())(item)
+
+    def compile(self) -> Callable[[Any], Any]:
+        if self._fn is None:
+            self._fn = _compile(self)
+        return self._fn
+
+    def __getstate__(self) -> Tuple[str, Tuple[Any, ...]]:
+        return self.op, self.args
+
+    def __setstate__(self, state: Tuple[str, Tuple[Any, ...]]) -> None:
+        self.op, self.args = state
+        self._fn = None
+
+    def source(self, var: str, namespace: Dict[str, Any]) -> str:
+        op, args = self.op, self.args
+        if op == 'this':
+            return var
+        if op == 'const':
+            return _literal(args[0], namespace)
+        if op in ('item', 'attr') and args[0].op == 'this' and isinstance(namespace, _Repr):
+            return f"F({args[1]!r})" if op == 'item' else f"F.attr({args[1]!r})"
+        if op == 'item':
+            return f"{args[0].source(var, namespace)}[{_literal(args[1], namespace)}]"
+        if op == 'attr':
+            base = args[0].source(var, namespace)
+            if all(part.isidentifier() and not keyword.iskeyword(part) for part in args[1].split('.')):
+                return f"{base}.{args[1]}"
+            return f"{_literal(attrgetter(args[1]), namespace)}({base})"
+        if op in ('and', 'or'):
+            symbol = op if _is_boolean(self) else _BITWISE[op]
+            return f"({args[0].source(var, namespace)} {symbol} {args[1].source(var, namespace)})"
+        if op == 'invert':
+            return f"({'not ' if _is_boolean(args[0]) else '~'}{args[0].source(var, namespace)})"
+        if op in _BINARY:
+            return f"({args[0].source(var, namespace)} {_BINARY[op]} {args[1].source(var, namespace)})"
+        if op in _UNARY:
+            return _UNARY[op].format(args[0].source(var, namespace))
+        if op in ('startswith', 'endswith'):
+            return f"{args[0].source(var, namespace)}.{op}({_literal(args[1], namespace)})"
+        if op == 'contains':
+            return f"({_literal(args[1], namespace)} in {args[0].source(var, namespace)})"
+        if op == 'isin':
+            return f"({args[0].source(var, namespace)} in {_literal(args[1], namespace)})"
+        if op == 'between':
+            return f"({_literal(args[1], namespace)} <= {args[0].source(var, namespace)} <= {_literal(args[2], namespace)})"
+        if op == 'apply':
+            return f"{_literal(args[1], namespace)}({args[0].source(var, namespace)})"
+        raise ValueError(f"Unknown expression: {op!r}")
+
+    def same(self, other: Any) -> bool:
+        return isinstance(other, PynExpr) and self.op == other.op and len(self.args) == len(other.args) \
+            and all(a.same(b) if isinstance(a, PynExpr) else type(a) is type(b) and a == b for a, b in zip(self.args, other.args))
+
+    def fields(self) -> FrozenSet[str]:
+        if self.op in ('item', 'attr') and self.args[0].op == 'this':
+            return frozenset((self.args[1],))
+        return frozenset().union(*(a.fields() for a in self.args if isinstance(a, PynExpr)))
+
+    def is_field(self) -> bool:
+        return self.op in ('item', 'attr') and self.args[0].op == 'this'
+
+    # OPERATORS
+
+    def __getitem__(self, key: Any) -> 'PynExpr':
+        return PynExpr('item', self, key)
+
+    def __eq__(self, other: Any) -> 'PynExpr':  # type: ignore[override]
+        return PynExpr('eq', self, _wrap(other))
+
+    def __ne__(self, other: Any) -> 'PynExpr':  # type: ignore[override]
+        return PynExpr('ne', self, _wrap(other))
+
+    def __lt__(self, other: Any) -> 'PynExpr':
+        return PynExpr('lt', self, _wrap(other))
+
+    def __le__(self, other: Any) -> 'PynExpr':
+        return PynExpr('le', self, _wrap(other))
+
+    def __gt__(self, other: Any) -> 'PynExpr':
+        return PynExpr('gt', self, _wrap(other))
+
+    def __ge__(self, other: Any) -> 'PynExpr':
+        return PynExpr('ge', self, _wrap(other))
+
+    def __add__(self, other: Any) -> 'PynExpr':
+        return PynExpr('add', self, _wrap(other))
+
+    def __radd__(self, other: Any) -> 'PynExpr':
+        return PynExpr('add', _wrap(other), self)
+
+    def __sub__(self, other: Any) -> 'PynExpr':
+        return PynExpr('sub', self, _wrap(other))
+
+    def __rsub__(self, other: Any) -> 'PynExpr':
+        return PynExpr('sub', _wrap(other), self)
+
+    def __mul__(self, other: Any) -> 'PynExpr':
+        return PynExpr('mul', self, _wrap(other))
+
+    def __rmul__(self, other: Any) -> 'PynExpr':
+        return PynExpr('mul', _wrap(other), self)
+
+    def __truediv__(self, other: Any) -> 'PynExpr':
+        return PynExpr('truediv', self, _wrap(other))
+
+    def __rtruediv__(self, other: Any) -> 'PynExpr':
+        return PynExpr('truediv', _wrap(other), self)
+
+    def __floordiv__(self, other: Any) -> 'PynExpr':
+        return PynExpr('floordiv', self, _wrap(other))
+
+    def __mod__(self, other: Any) -> 'PynExpr':
+        return PynExpr('mod', self, _wrap(other))
+
+    def __pow__(self, other: Any) -> 'PynExpr':
+        return PynExpr('pow', self, _wrap(other))
+
+    def __and__(self, other: Any) -> 'PynExpr':
+        return PynExpr('and', self, _wrap(other))
+
+    def __or__(self, other: Any) -> 'PynExpr':
+        return PynExpr('or', self, _wrap(other))
+
+    def __invert__(self) -> 'PynExpr':
+        return PynExpr('invert', self)
+
+    def __neg__(self) -> 'PynExpr':
+        return PynExpr('neg', self)
+
+    def __abs__(self) -> 'PynExpr':
+        return PynExpr('abs', self)
+
+    def __bool__(self) -> bool:
+        raise TypeError("PynExpr has no truth value; use & | ~ instead of and/or/not")
+
+    __hash__ = object.__hash__
+
+    attr = _Attr()
+
+    # METHODS
+
+    def startswith(self, prefix: Any) -> 'PynExpr':
+        return PynExpr('startswith', self, prefix)
+
+    def endswith(self, suffix: Any) -> 'PynExpr':
+        return PynExpr('endswith', self, suffix)
+
+    def contains(self, item: Any) -> 'PynExpr':
+        return PynExpr('contains', self, item)
+
+    def isin(self, values: Iterable[Any]) -> 'PynExpr':
+        values = tuple(values)
+        try:
+            return PynExpr('isin', self, frozenset(values))
+        except TypeError:
+            return PynExpr('isin', self, values)
+
+    def between(self, low: Any, high: Any) -> 'PynExpr':
+        return PynExpr('between', self, low, high)
+
+    def is_none(self) -> 'PynExpr':
+        return PynExpr('is_none', self)
+
+    def is_not_none(self) -> 'PynExpr':
+        return PynExpr('is_not_none', self)
+
+    def apply(self, func: Callable[[Any], Any]) -> 'PynExpr':
+        return PynExpr('apply', self, func)
+
+    def __repr__(self) -> str:
+        return self.source('F()', _Repr())
+
+    # ALIASES
+    startsWith = startswith
+    endsWith = endswith
+    isIn = isin
+    isNone = is_none
+    isNotNone = is_not_none
+
+
+class F(PynExpr):
+    __slots__ = ()
+
+    def __init__(self, *keys: Any):
+        expr = PynExpr('this')
+        for key in keys:
+            expr = PynExpr('item', expr, key)
+        super().__init__(expr.op, *expr.args)
+
+    @staticmethod
+    def const(value: Any) -> PynExpr:
+        return PynExpr('const', value)
+
+
+def compiled(func: Any) -> Any:
+    return func.compile() if isinstance(func, PynExpr) else func
+
+def key_equality(predicate: Any, key: Any) -> Optional[Tuple[Any, Optional[PynExpr]]]:
+    if not isinstance(predicate, PynExpr) or not isinstance(key, PynExpr):
+        return None
+    if predicate.op == 'eq':
+        left, right = predicate.args
+        if left.same(key) and right.op == 'const':
+            return right.args[0], None
+        if right.same(key) and left.op == 'const':
+            return left.args[0], None
+    if predicate.op == 'and' and _is_boolean(predicate):
+        for this, other in (predicate.args, predicate.args[::-1]):
+            found = key_equality(this, key)
+            if found is not None:
+                return found[0], other if found[1] is None else found[1] & other
+    return None
+
+
+# PRIVATE
+
+_BINARY = {
+    'eq': '==', 'ne': '!=', 'lt': '<', 'le': '<=', 'gt': '>', 'ge': '>=',
+    'add': '+', 'sub': '-', 'mul': '*', 'truediv': '/', 'floordiv': '//', 'mod': '%', 'pow': '**',
+}
+
+_UNARY = {
+    'neg': '(-{})', 'abs': 'abs({})', 'is_none': '({} is None)', 'is_not_none': '({} is not None)',
+}
+
+
+class _Repr(Dict[str, Any]):
+    pass
+
+
+_BITWISE = {'and': '&', 'or': '|'}
+
+_PREDICATES = frozenset(('eq', 'ne', 'lt', 'le', 'gt', 'ge', 'startswith', 'endswith', 'contains', 'isin', 'between', 'is_none', 'is_not_none'))
+
+
+def _is_boolean(expr: PynExpr) -> bool:
+    if expr.op == 'const':
+        return type(expr.args[0]) is bool
+    if expr.op in ('and', 'or'):
+        return all(_is_boolean(a) for a in expr.args)
+    if expr.op == 'invert':
+        return _is_boolean(expr.args[0])
+    return expr.op in _PREDICATES
+
+def _wrap(value: Any) -> PynExpr:
+    return value if isinstance(value, PynExpr) else PynExpr('const', value)
+
+def _literal(value: Any, namespace: Dict[str, Any]) -> str:
+    if value is None or type(value) in (bool, int, str, bytes) or (type(value) is float and math.isfinite(value)):
+        return repr(value)
+    if isinstance(namespace, _Repr):
+        return getattr(value, '__qualname__', None) or repr(value)
+    name = f"_c{len(namespace)}"
+    namespace[name] = value
+    return name
+
+def _compile(expr: PynExpr) -> Callable[[Any], Any]:
+    if expr.op == 'this':
+        return _this
+    if expr.op == 'item' and expr.args[0].op == 'this':
+        return itemgetter(expr.args[1])
+    if expr.op == 'attr' and expr.args[0].op == 'this':
+        return attrgetter(expr.args[1])
+    namespace: Dict[str, Any] = {}
+    source = expr.source('x', namespace)
+    exec(f"def expr(x):\n    return {source}", namespace)
+    return namespace['expr']
+
+def _this(value: Any) -> Any:
+    return value
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynExpr!')
@@ -1,6 +1,7 @@
 # pynq/pyngrouping.py
-from typing import Generic, Iterable
-from typing import List, Tuple, Iterator, TypeVar
+from typing import Generic, Iterable, Optional
+from typing import Any, Dict, List, Tuple, Iterator, Sequence, TypeVar
+from array import array
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .pynquery import PynQuery
@@ -29,5 +30,101 @@ class PynGrouping(Generic[K, U], Iterable[U]):
     asQueryable = as_queryable
 
 
+class PynGroupIndex(Generic[K, U], Sequence):
+
+    def __init__(self, keys: List[K], values: Sequence[U], offsets: 'array[int]', order: 'array[int]'):
+        self._keys = keys
+        self._values = values
+        self._offsets = offsets
+        self._order = order
+        self._order_view = memoryview(order)
+        self._ids: Optional[Dict[K, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("group index out of range")
+        return PynGroupView(self, index)
+
+    def __iter__(self) -> Iterator['PynGroupView[K, U]']:
+        return (PynGroupView(self, i) for i in range(len(self._keys)))
+
+    @property
+    def offsets(self) -> 'array[int]':
+        return self._offsets
+
+    @property
+    def order(self) -> 'array[int]':
+        return self._order
+
+    def keys(self) -> List[K]:
+        return list(self._keys)
+
+    def sizes(self) -> 'array[int]':
+        offsets = self._offsets
+        return array(offsets.typecode, (offsets[i + 1] - offsets[i] for i in range(len(self._keys))))
+
+    def group(self, key: K) -> 'PynGroupView[K, U]':
+        return PynGroupView(self, self._lookup()[key])
+
+    def get(self, key: K, default: Optional[Any] = None) -> Any:
+        i = self._lookup().get(key)
+        return default if i is None else PynGroupView(self, i)
+
+    def has_key(self, key: K) -> bool:
+        return key in self._lookup()
+
+    def _lookup(self) -> Dict[K, int]:
+        if self._ids is None:
+            self._ids = {key: i for i, key in enumerate(self._keys)}
+        return self._ids
+
+
+class PynGroupView(Generic[K, U], Sequence):
+    __slots__ = ('key', '_index', '_start', '_stop')
+
+    def __init__(self, index: PynGroupIndex[K, U], i: int):
+        self.key = index._keys[i]
+        self._index = index
+        self._start = index._offsets[i]
+        self._stop = index._offsets[i + 1]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("group index out of range")
+        return self._index._values[self._index._order[self._start + index]]
+
+    def __iter__(self) -> Iterator[U]:
+        return map(self._index._values.__getitem__, self._index._order_view[self._start:self._stop])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Sequence) and len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"PynGroupView({self.key!r}, {list(self)!r})"
+
+    def as_queryable(self) -> 'PynQuery[U]':
+        from .pynquery import PynQuery
+        return PynQuery(self)
+
+    def as_tuple(self) -> Tuple[K, List[U]]:
+        return (self.key, list(self))
+
+    asQueryable = as_queryable
+
+
 if __name__ == '__main__':
     print('Hello PYNQ.PynGrouping!')
@@ -0,0 +1,119 @@
+# pynq/pynindexed.py
+from typing import Callable, Iterable, Optional
+from typing import Any, Dict, List, Tuple, TypeVar
+from bisect import bisect_left, bisect_right
+from .core import to_lookup
+from .pynquery import PynQuery
+from .pynexpr import key_equality
+
+
+# FOOL OF A ...
+T = TypeVar('T')
+U = TypeVar('U')
+K = TypeVar('K')
+
+_MISSING = object()
+
+
+class PynIndexedQuery(PynQuery[T]):
+
+    def __init__(self, iterable: Iterable[T], key_selector: Callable[[T], K], sorted_index: bool = False):
+        self._items: List[T] = list(iterable)
+        super().__init__(self._items)
+        self.key_selector = key_selector
+        self._sorted_index = sorted_index
+        self._index: Optional[Dict[K, List[T]]] = None
+        self._sorted: Optional[Tuple[List[K], List[T]]] = None
+
+    def _build(self) -> Dict[K, List[T]]:
+        if self._index is None:
+            self._index = to_lookup(self._items, self.key_selector)
+        return self._index
+
+    def _build_sorted(self) -> Tuple[List[K], List[T]]:
+        if not self._sorted_index:
+            raise ValueError("Range lookups require indexed(..., sorted_index=True)")
+        if self._sorted is None:
+            keyed = sorted(((self.key_selector(x), x) for x in self._items), key=lambda kx: kx[0])
+            self._sorted = ([k for k, _ in keyed], [x for _, x in keyed])
+        return self._sorted
+
+    # LOOKUPS
+
+    def lookup(self, key: K) -> List[T]:
+        return self._build().get(key, [])
+
+    def where_key(self, key: K) -> 'PynQuery[T]':
+        return PynQuery(self.lookup(key))
+
+    def where_keys(self, keys: Iterable[K]) -> 'PynQuery[T]':
+        index = self._build()
+        return PynQuery([x for key in dict.fromkeys(keys) for x in index.get(key, ())])
+
+    def where_range(self, low: Optional[K] = None, high: Optional[K] = None, include_low: bool = True, include_high: bool = True) -> 'PynQuery[T]':
+        keys, items = self._build_sorted()
+        start = 0 if low is None else (bisect_left if include_low else bisect_right)(keys, low)
+        stop = len(keys) if high is None else (bisect_right if include_high else bisect_left)(keys, high)
+        return PynQuery(items[start:stop])
+
+    def where(self, predicate: Callable[[T], bool]) -> 'PynQuery[T]':
+        found = key_equality(predicate, self.key_selector)
+        if found is None:
+            return super().where(predicate)
+        key, rest = found
+        result = self.where_key(key)
+        return result if rest is None else result.where(rest)
+
+    def contains_key(self, key: K) -> bool:
+        return key in self._build()
+
+    def contains(self, item: T) -> bool:
+        try:
+            key = self.key_selector(item)
+        except (TypeError, KeyError, IndexError, AttributeError):
+            return super().contains(item)
+        return item in self._build().get(key, ())
+
+    def first_key(self, key: K) -> T:
+        values = self.lookup(key)
+        if not values:
+            raise ValueError("No matching element found")
+        return values[0]
+
+    def first_or_default_key(self, key: K, default: Optional[T] = None) -> Optional[T]:
+        values = self.lookup(key)
+        return values[0] if values else default
+
+    def join(self, inner: Iterable[U], outer_key_selector: Callable[[T], K], inner_key_selector: Callable[[U], K], result_selector: Optional[Callable[[T, U], Any]] = None, build: Optional[str] = None) -> 'PynQuery[Any]':
+        if outer_key_selector is not self.key_selector or build == 'inner':
+            return super().join(inner, outer_key_selector, inner_key_selector, result_selector, build)
+        return PynQuery(_IndexProbe(self, inner, inner_key_selector, result_selector))
+
+    # ALIASES
+    whereKey = where_key
+    whereKeys = where_keys
+    whereRange = where_range
+    containsKey = contains_key
+    firstKey = first_key
+    firstOrDefaultKey = first_or_default_key
+
+
+# PRIVATE
+
+class _IndexProbe(Iterable[Any]):
+
+    def __init__(self, query: PynIndexedQuery, inner: Iterable[U], inner_key_selector: Callable[[U], K], result_selector: Optional[Callable[[T, U], Any]]):
+        self._query = query
+        self._inner = inner
+        self._inner_key_selector = inner_key_selector
+        self._result_selector = (lambda o, i: (o, i)) if result_selector is None else result_selector
+
+    def __iter__(self):
+        index = self._query._build()
+        for i in self._inner:
+            for o in index.get(self._inner_key_selector(i), ()):
+                yield self._result_selector(o, i)
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynIndexedQuery!')
@@ -0,0 +1,64 @@
+# pynq/pynmemo.py
+from typing import Generic, Iterable
+from typing import Any, List, Iterator, Optional, TypeVar
+from threading import Lock
+
+
+# FOOL OF A ...
+T = TypeVar('T')
+
+_MISSING = object()
+
+
+class PynMemo(Generic[T], Iterable[T]):
+
+    def __init__(self, source: Iterable[T]):
+        self._source = source
+        self._it: Optional[Iterator[T]] = None
+        self._cache: List[T] = []
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._lock = Lock()
+
+    def __iter__(self) -> Iterator[T]:
+        cache = self._cache
+        i = 0
+        while True:
+            if i < len(cache):
+                yield cache[i]
+                i += 1
+                continue
+            if not self._pull(i):
+                return
+
+    def _pull(self, i: int) -> bool:
+        with self._lock:
+            if i < len(self._cache):
+                return True
+            if self._done:
+                return False
+            if self._error is not None:
+                raise self._error
+            try:
+                if self._it is None:
+                    self._it = iter(self._source)
+                item: Any = next(self._it, _MISSING)
+            except Exception as e:
+                self._error = e
+                self._it = None
+                raise
+            if item is _MISSING:
+                self._done = True
+                self._it = None
+                self._source = None
+                return False
+            self._cache.append(item)
+            return True
+
+    @property
+    def is_complete(self) -> bool:
+        return self._done
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynMemo!')
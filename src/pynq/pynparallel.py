@@ -0,0 +1,139 @@
+# pynq/pynparallel.py
+from typing import Generic, Callable, Iterable, Optional
+from typing import Any, Dict, List, Tuple, Iterator, TypeVar
+from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+import os
+from .core import where, select, select_many, count, sum_of, min_of, max_of, _bounded_map, _chunk_iter
+from .numeric import reduce_sum, reduce_min, reduce_max
+from .pyngrouping import PynGrouping
+from .pynplan import PynPlan, PynStage
+if TYPE_CHECKING:
+    from .pynquery import PynQuery
+
+
+# FOOL OF A ...
+T = TypeVar('T')
+U = TypeVar('U')
+K = TypeVar('K')
+
+
+class PynParallelQuery(Generic[T]):
+
+    def __init__(self, source: Iterable[Any], workers: Optional[int] = None, chunk_size: int = 1024, ordered: bool = False, stages: Tuple[PynStage, ...] = ()):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._source = source
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._ordered = ordered
+        self._stages = tuple(stages)
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk in self._run(_list_of):
+            yield from chunk
+
+    def _then(self, name: str, func: Callable[..., Iterable[Any]], *args: Any) -> 'PynParallelQuery':
+        return PynParallelQuery(self._source, self._workers, self._chunk_size, self._ordered, self._stages + (PynStage(name, func, args),))
+
+    def _run(self, reducer: Callable[..., Any], *args: Any) -> Iterator[Any]:
+        chunks = ((self._stages, chunk, reducer, args) for chunk in _chunk_iter(self._source, self._chunk_size))
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            yield from _bounded_map(executor, _run_chunk, chunks, self._workers * 2, self._ordered)
+
+    # OPTIONS
+
+    def as_ordered(self) -> 'PynParallelQuery[T]':
+        return PynParallelQuery(self._source, self._workers, self._chunk_size, True, self._stages)
+
+    def as_unordered(self) -> 'PynParallelQuery[T]':
+        return PynParallelQuery(self._source, self._workers, self._chunk_size, False, self._stages)
+
+    def as_sequential(self) -> 'PynQuery[T]':
+        from .pynquery import PynQuery
+        return PynQuery(self)
+
+    # FILTER & TRANSFORM
+
+    def where(self, predicate: Callable[[T], bool]) -> 'PynParallelQuery[T]':
+        return self._then('where', where, predicate)
+
+    def select(self, selector: Callable[[T], U]) -> 'PynParallelQuery[U]':
+        return self._then('select', select, selector)
+
+    def select_many(self, key_selector: Callable[[T], Iterable[U]]) -> 'PynParallelQuery[U]':
+        return self._then('select_many', select_many, key_selector)
+
+    # TERMINAL
+
+    def to_list(self) -> List[T]:
+        return list(self)
+
+    def count(self, predicate: Optional[Callable[[T], bool]] = None) -> int:
+        return sum(self._run(count, predicate))
+
+    def sum(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> T:
+        return reduce_sum(self._run(sum_of, predicate, key_selector))
+
+    def min(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> T:
+        return reduce_min(x for x in self._run(min_of, predicate, key_selector) if x is not None)
+
+    def max(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> T:
+        return reduce_max(x for x in self._run(max_of, predicate, key_selector) if x is not None)
+
+    def avg(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> Optional[float]:
+        total, items = 0, 0
+        for partial_total, partial_items in self._run(_total_and_count, predicate, key_selector):
+            total += partial_total
+            items += partial_items
+        return total / items if items else None
+
+    def distinct(self) -> 'PynQuery[T]':
+        from .pynquery import PynQuery
+        seen: Dict[T, None] = {}
+        for partial in self._run(_distinct_of):
+            seen.update(dict.fromkeys(partial))
+        return PynQuery(list(seen))
+
+    def group_by(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> 'PynQuery[PynGrouping[K, U]]':
+        from .pynquery import PynQuery
+        groups: Dict[K, List[U]] = {}
+        for partial in self._run(_groups_of, key_selector, value_selector):
+            for key, values in partial.items():
+                groups.setdefault(key, []).extend(values)
+        return PynQuery([PynGrouping(k, v) for k, v in groups.items()])
+
+    # ALIASES
+    toList = to_list
+    asOrdered = as_ordered
+    asUnordered = as_unordered
+    asSequential = as_sequential
+    selectMany = select_many
+    groupBy = group_by
+
+
+# PRIVATE
+
+def _run_chunk(stages: Tuple[PynStage, ...], chunk: List[Any], reducer: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+    return reducer(PynPlan(chunk, stages).execute(), *args)
+
+def _list_of(values: Iterable[T]) -> List[T]:
+    return list(values)
+
+def _total_and_count(values: Iterable[T], predicate: Optional[Callable[[T], bool]], key_selector: Optional[Callable[[T], K]]) -> Tuple[Any, int]:
+    filtered = values if key_selector is None else map(key_selector, values)
+    filtered = list(filtered if predicate is None else filter(predicate, filtered))
+    return reduce_sum(filtered), len(filtered)
+
+def _distinct_of(values: Iterable[T]) -> List[T]:
+    return list(dict.fromkeys(values))
+
+def _groups_of(values: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]]) -> Dict[K, List[U]]:
+    groups: Dict[K, List[U]] = {}
+    for item in values:
+        groups.setdefault(key_selector(item), []).append(value_selector(item) if value_selector is not None else item)
+    return groups
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynParallelQuery!')
@@ -0,0 +1,147 @@
+# pynq/pynplan.py
+from typing import Callable, Iterable
+from typing import Any, List, Optional, Sized, Tuple, Iterator, NamedTuple, TypeVar
+from .core import take, skip, order_by_keys, take_ordered_keys, _MappedView, _SLICEABLE
+from .pynprofile import PynProfile, ProfileHook, get_profile_hook, instrument
+from .pynexpr import PynExpr, compiled
+
+
+# FOOL OF A ...
+T = TypeVar('T')
+
+
+class PynStage(NamedTuple):
+    name: str
+    func: Callable[..., Iterable[Any]]
+    args: Tuple[Any, ...] = ()
+
+
+class PynPlan:
+
+    def __init__(self, source: Iterable[T], stages: Tuple[PynStage, ...] = ()):
+        self.source = source
+        self.stages = tuple(stages)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.execute())
+
+    def then(self, name: str, func: Callable[..., Iterable[Any]], *args: Any) -> 'PynPlan':
+        return PynPlan(self.source, self.stages + (PynStage(name, func, args),))
+
+    def execute(self) -> Iterable[T]:
+        stages = _rewrite(list(self.stages))
+        hook = get_profile_hook()
+        if hook is not None:
+            return instrument(self.source, _unfused(stages), hook)
+        seq = self.source
+        for segment in _segments(stages):
+            if segment[0].name in _FUSIBLE:
+                seq = _fuse(segment)(seq)
+            else:
+                seq = segment[0].func(seq, *_compiled_args(segment[0].args))
+        return seq
+
+    def explain(self) -> str:
+        lines = [f"source: {_describe(self.source)}"]
+        for segment in _segments(_rewrite(list(self.stages))):
+            steps = ', '.join(f"{s.name}({', '.join(_describe(a) for a in s.args)})" for s in segment)
+            lines.append(f"-> fused[{steps}]" if segment[0].name in _FUSIBLE and len(segment) > 1 else f"-> {steps}")
+        return '\n'.join(lines)
+
+    def profile(self, hook: Optional[ProfileHook] = None) -> PynProfile:
+        profiles: List[PynProfile] = []
+        for _ in instrument(self.source, _unfused(_rewrite(list(self.stages))), profiles.append):
+            pass
+        if hook is not None:
+            hook(profiles[0])
+        return profiles[0]
+
+
+# PRIVATE
+
+_FUSIBLE = ('where', 'select')
+
+_ORDERINGS = ('order_by', 'order_by_desc')
+
+def _rewrite(stages: List[PynStage]) -> List[PynStage]:
+    result: List[PynStage] = []
+    for stage in stages:
+        prev = result[-1] if result else None
+        if stage.name in _ORDERINGS:
+            result.append(PynStage('order_by_keys', order_by_keys, (((stage.args[0], stage.name == 'order_by_desc'),),) + stage.args[1:]))
+        elif stage.name == 'then_by' and prev and prev.name == 'order_by_keys':
+            result[-1] = PynStage('order_by_keys', order_by_keys, (prev.args[0] + stage.args,) + prev.args[1:])
+        elif stage.name == 'where' and prev and prev.name == 'order_by_keys':
+            orderings = []
+            while result and result[-1].name == 'order_by_keys':
+                orderings.insert(0, result.pop())
+            result += [stage] + orderings
+        elif stage.name == 'take' and prev and prev.name == 'order_by_keys':
+            result[-1] = PynStage('take_ordered_keys', take_ordered_keys, (stage.args[0], prev.args[0]))
+        elif stage.name == 'take' and prev and prev.name == 'skip' and len(result) > 1 and result[-2].name == 'order_by_keys' and stage.args[0] >= 0:
+            result[-2:] = [PynStage('take_ordered_keys', take_ordered_keys, (prev.args[0] + stage.args[0], result[-2].args[0])), prev]
+        elif stage.name == 'take' and prev and prev.name == 'take_ordered_keys':
+            result[-1] = PynStage(prev.name, prev.func, (min(prev.args[0], stage.args[0]),) + prev.args[1:])
+        elif prev and prev.name == stage.name == 'take':
+            result[-1] = PynStage('take', take, (min(prev.args[0], stage.args[0]),))
+        elif prev and prev.name == stage.name == 'skip' and min(prev.args[0], stage.args[0]) >= 0:
+            result[-1] = PynStage('skip', skip, (prev.args[0] + stage.args[0],))
+        else:
+            result.append(stage)
+    return result
+
+def _segments(stages: List[PynStage]) -> List[List[PynStage]]:
+    segments: List[List[PynStage]] = []
+    for stage in stages:
+        if segments and stage.name in _FUSIBLE and segments[-1][0].name in _FUSIBLE:
+            segments[-1].append(stage)
+        else:
+            segments.append([stage])
+    return segments
+
+def _describe(arg: Any) -> str:
+    if isinstance(arg, PynExpr):
+        return repr(arg)
+    if callable(arg):
+        return getattr(arg, '__qualname__', None) or type(arg).__name__
+    if type(arg) is tuple:
+        return f"({', '.join(_describe(a) for a in arg)})"
+    if arg is None or isinstance(arg, (int, float, str, bytes)):
+        return repr(arg)
+    if isinstance(arg, Sized):
+        return f"{type(arg).__name__}[{len(arg)}]"
+    return type(arg).__name__
+
+def _unfused(stages: List[PynStage]) -> List[PynStage]:
+    return [PynStage(s.name, _lazy_where if s.name == 'where' else _lazy_select, s.args) if s.name in _FUSIBLE else s for s in stages]
+
+def _lazy_where(seq: Iterable[Any], predicate: Callable[[Any], bool]) -> Iterator[Any]:
+    return filter(predicate, seq)
+
+def _lazy_select(seq: Iterable[Any], selector: Callable[[Any], Any]) -> Iterable[Any]:
+    return _MappedView(seq, selector) if isinstance(seq, _SLICEABLE) else map(selector, seq)
+
+def _compiled_args(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    return tuple(_compiled_args(a) if type(a) is tuple else compiled(a) for a in args)
+
+def _fuse(stages: List[PynStage]) -> Callable[[Iterable[Any]], Iterable[Any]]:
+    if len(stages) == 1 and not (stages[0].name == 'where' and isinstance(stages[0].args[0], PynExpr)):
+        fn = compiled(stages[0].args[0])
+        return (lambda seq: filter(fn, seq)) if stages[0].name == 'where' else (lambda seq: _lazy_select(seq, fn))
+    namespace: dict = {}
+    lines = ['def fused(seq):', '    for x in seq:']
+    for i, stage in enumerate(stages):
+        fn = stage.args[0]
+        if isinstance(fn, PynExpr):
+            call = fn.source('x', namespace)
+        else:
+            call = f'f{i}(x)'
+            namespace[f'f{i}'] = fn
+        lines.append(f'        if not {call}: continue' if stage.name == 'where' else f'        x = {call}')
+    lines.append('        yield x')
+    exec('\n'.join(lines), namespace)
+    return namespace['fused']
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynPlan!')
@@ -0,0 +1,131 @@
+# pynq/pynprofile.py
+from typing import Callable, Iterable, Optional
+from typing import Any, List, Tuple, Iterator, NamedTuple, Sized
+from time import perf_counter
+
+
+class PynStageProfile(NamedTuple):
+    name: str
+    rows_in: int
+    rows_out: int
+    seconds: float
+    user_seconds: float
+    materialized: Optional[int]
+
+    @property
+    def overhead_seconds(self) -> float:
+        return max(self.seconds - self.user_seconds, 0.0)
+
+    def as_dict(self) -> dict:
+        return dict(self._asdict(), overhead_seconds=self.overhead_seconds)
+
+
+class PynProfile(NamedTuple):
+    stages: Tuple[PynStageProfile, ...]
+    rows: int
+    seconds: float
+
+    def as_dict(self) -> dict:
+        return {"stages": [s.as_dict() for s in self.stages], "rows": self.rows, "seconds": self.seconds}
+
+    def report(self) -> str:
+        lines = [f"{'stage':<20} {'rows in':>10} {'rows out':>10} {'ms':>10} {'user ms':>10} {'overhead ms':>12} {'materialized':>12}"]
+        for s in self.stages:
+            lines.append(f"{s.name:<20} {s.rows_in:>10} {s.rows_out:>10} {s.seconds * 1e3:>10.3f} {s.user_seconds * 1e3:>10.3f} "
+                         f"{s.overhead_seconds * 1e3:>12.3f} {'' if s.materialized is None else s.materialized:>12}")
+        lines.append(f"{'total':<20} {'':>10} {self.rows:>10} {self.seconds * 1e3:>10.3f}")
+        return '\n'.join(lines)
+
+
+ProfileHook = Callable[[PynProfile], None]
+
+_hook: Optional[ProfileHook] = None
+
+
+def set_profile_hook(hook: Optional[ProfileHook]) -> None:
+    global _hook
+    _hook = hook
+
+def get_profile_hook() -> Optional[ProfileHook]:
+    return _hook
+
+def instrument(source: Iterable[Any], stages: Iterable[Any], hook: Optional[ProfileHook]) -> Iterator[Any]:
+    upstream = _Meter(source)
+    probes: List[Tuple[str, _Meter, _Meter, float, _Clock, Optional[int]]] = []
+    for stage in stages:
+        clock = _Clock()
+        args = _timed(stage.args, clock)
+        start = perf_counter()
+        out = stage.func(upstream, *args)
+        call = perf_counter() - start
+        meter = _Meter(out)
+        probes.append((stage.name, upstream, meter, call, clock, len(out) if isinstance(out, Sized) else None))
+        upstream = meter
+    try:
+        yield from upstream
+    finally:
+        if hook is not None:
+            hook(_collect(source, probes, upstream))
+
+
+# PRIVATE
+
+class _Clock:
+
+    def __init__(self):
+        self.seconds = 0.0
+
+
+class _Meter(Iterator[Any]):
+
+    def __init__(self, source: Iterable[Any]):
+        self._it = iter(source)
+        self.count = 0
+        self.seconds = 0.0
+
+    def __next__(self) -> Any:
+        start = perf_counter()
+        try:
+            item = next(self._it)
+        finally:
+            self.seconds += perf_counter() - start
+        self.count += 1
+        return item
+
+
+class _Timed:
+
+    def __init__(self, func: Callable[..., Any], clock: _Clock):
+        self._func = func
+        self._clock = clock
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return self._func(*args, **kwargs)
+        finally:
+            self._clock.seconds += perf_counter() - start
+
+
+def _timed(arg: Any, clock: _Clock) -> Any:
+    if callable(arg):
+        return _Timed(arg, clock)
+    if type(arg) is tuple:
+        return tuple(_timed(a, clock) for a in arg)
+    if type(arg) is dict:
+        return {k: _timed(v, clock) for k, v in arg.items()}
+    return arg
+
+def _collect(source: Iterable[Any], probes: List[Tuple[str, '_Meter', '_Meter', float, _Clock, Optional[int]]], last: '_Meter') -> PynProfile:
+    first = probes[0][1] if probes else last
+    stages = [PynStageProfile('source', first.count, first.count, first.seconds, 0.0, len(source) if isinstance(source, Sized) else None)]
+    total = first.seconds
+    for name, upstream, meter, call, clock, materialized in probes:
+        seconds = max(call + meter.seconds - upstream.seconds, 0.0)
+        stages.append(PynStageProfile(name, upstream.count, meter.count, seconds, clock.seconds, materialized))
+        total += seconds
+    return PynProfile(tuple(stages), last.count, total)
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynProfile!')
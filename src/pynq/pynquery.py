@@ -1,14 +1,26 @@
 # pynq/pynquery.py
 from .core import (
-    has_any, to_list, has, count, sum_of, avg_of, min_of, max_of,
-    distinct, contains, contains_all, first, first_or_default, last,
-    last_or_default, take, take_last, skip, skip_last, where, select,
-    select_many, with_min, with_max, order_by, order_by_desc, group_by,
-    aggregate, concatenate
+    has_any, to_list, to_lookup, to_dict, has, count, sum_of, avg_of,
+    min_of, max_of, stats, aggregate_many, distinct, distinct_by, union,
+    union_by, intersect, intersect_by, except_, except_by, contains,
+    contains_all, first, first_or_default, last, last_or_default, take,
+    take_last, skip, skip_last, where, select, select_concurrent,
+    select_many, with_min, with_max, min_by, max_by, min_max_by, order_by,
+    order_by_desc, order_by_keys, group_by, group_by_compact, group_adjacent, group_aggregate,
+    aggregate, concatenate, join, left_join, group_join, chunk, batch_select
 )
-from .pyngrouping import PynGrouping
+from .pyngrouping import PynGrouping, PynGroupIndex, PynGroupView
+from .pynplan import PynPlan
+from .pynprofile import PynProfile, ProfileHook
+from .pynparallel import PynParallelQuery
+from .pynmemo import PynMemo
+from .pynstats import PynStats
+from .sources import FileSource, PathLike, BUFFER_SIZE, read_lines, read_csv, read_jsonl
 from typing import Generic, Callable, Iterable, Optional
-from typing import Any, List, Union, Iterator, TypeVar
+from typing import Any, Dict, List, Tuple, Union, Iterator, Sequence, TypeVar
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .pynindexed import PynIndexedQuery
 
 
 # FOOL OF A ...
@@ -19,8 +31,36 @@ K = TypeVar('K')
 
 class PynQuery(Generic[T]):
 
-    def __init__(self, iterable: Iterable[T]):
-        self._iterable = iterable
+    def __init__(self, iterable: Union[Iterable[T], PynPlan]):
+        if isinstance(iterable, PynQuery):
+            self._plan = iterable._plan
+        elif isinstance(iterable, PynPlan):
+            self._plan = iterable
+        else:
+            self._plan = PynPlan(iterable)
+
+    @classmethod
+    def from_lines(cls, path: PathLike, encoding: str = 'utf-8', use_mmap: bool = False, buffer_size: int = BUFFER_SIZE) -> 'PynQuery[str]':
+        return cls(FileSource(read_lines, path, encoding, use_mmap, buffer_size))
+
+    @classmethod
+    def from_csv(cls, path: PathLike, columns: Optional[Sequence[Union[str, int]]] = None, converters: Optional[Dict[Union[str, int], Callable[[str], Any]]] = None, header: bool = True, delimiter: str = ',', encoding: str = 'utf-8', buffer_size: int = BUFFER_SIZE) -> 'PynQuery[Dict[Union[str, int], Any]]':
+        return cls(FileSource(read_csv, path, columns, converters, header, delimiter, encoding, buffer_size))
+
+    @classmethod
+    def from_jsonl(cls, path: PathLike, fields: Optional[Sequence[str]] = None, encoding: str = 'utf-8', buffer_size: int = BUFFER_SIZE) -> 'PynQuery[Any]':
+        return cls(FileSource(read_jsonl, path, fields, encoding, buffer_size))
+
+    @property
+    def _iterable(self) -> Iterable[T]:
+        return self._plan.execute()
+
+    def _then(self, name: str, func: Callable[..., Iterable[Any]], *args: Any) -> 'PynQuery':
+        return PynQuery(self._plan.then(name, func, *args))
+
+    def _bounded(self, predicate: Optional[Callable[[T], bool]], n: int) -> 'PynQuery[T]':
+        query = self.where(predicate) if predicate is not None else self
+        return query.take(n)
 
     def __iter__(self):
         return iter(self._iterable)
@@ -51,6 +91,16 @@ class PynQuery(Generic[T]):
     def to_list(self) -> List[T]:
         return to_list(self._iterable)
 
+    def to_lookup(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> Dict[K, List[U]]:
+        return to_lookup(self._iterable, key_selector, value_selector)
+
+    def to_dict(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> Dict[K, U]:
+        return to_dict(self._iterable, key_selector, value_selector)
+
+    def indexed(self, key_selector: Callable[[T], K], sorted_index: bool = False) -> 'PynIndexedQuery[T]':
+        from .pynindexed import PynIndexedQuery
+        return PynIndexedQuery(self._iterable, key_selector, sorted_index)
+
     def has(self, predicate: Optional[Callable[[T], bool]] = None) -> bool:
         return has(self._iterable, predicate)
 
@@ -69,8 +119,35 @@ class PynQuery(Generic[T]):
     def max(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> T:
         return max_of(self._iterable, predicate, key_selector)
 
+    def stats(self, selector: Optional[Callable[[T], K]] = None, ddof: int = 0) -> PynStats:
+        return stats(self._iterable, selector, ddof)
+
+    def aggregate_many(self, **aggregates: Any) -> Dict[str, Any]:
+        return aggregate_many(self._iterable, **aggregates)
+
     def distinct(self) -> 'PynQuery[T]':
-        return PynQuery(distinct(self._iterable))
+        return self._then('distinct', distinct)
+
+    def distinct_by(self, key_selector: Callable[[T], K]) -> 'PynQuery[T]':
+        return self._then('distinct_by', distinct_by, key_selector)
+
+    def union(self, other: Iterable[T]) -> 'PynQuery[T]':
+        return self._then('union', union, other)
+
+    def union_by(self, other: Iterable[T], key_selector: Callable[[T], K]) -> 'PynQuery[T]':
+        return self._then('union_by', union_by, other, key_selector)
+
+    def intersect(self, other: Iterable[T]) -> 'PynQuery[T]':
+        return self._then('intersect', intersect, other)
+
+    def intersect_by(self, other: Iterable[T], key_selector: Callable[[T], K]) -> 'PynQuery[T]':
+        return self._then('intersect_by', intersect_by, other, key_selector)
+
+    def except_(self, other: Iterable[T]) -> 'PynQuery[T]':
+        return self._then('except_', except_, other)
+
+    def except_by(self, other: Iterable[T], key_selector: Callable[[T], K]) -> 'PynQuery[T]':
+        return self._then('except_by', except_by, other, key_selector)
 
     def contains(self, item: T) -> bool:
         return contains(self._iterable, item)
@@ -79,10 +156,10 @@ class PynQuery(Generic[T]):
         return contains_all(self._iterable, items)
 
     def first(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
-        return first(self._iterable, predicate)
+        return first(self._bounded(predicate, 1)._iterable)
 
     def first_or_default(self, predicate: Optional[Callable[[T], bool]] = None, default: Optional[T] = None) -> Optional[T]:
-        return first_or_default(self._iterable, predicate, default)
+        return first_or_default(self._bounded(predicate, 1)._iterable, None, default)
 
     def last(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
         return last(self._iterable, predicate)
@@ -91,69 +168,163 @@ class PynQuery(Generic[T]):
         return last_or_default(self._iterable, predicate, default)
 
     def take(self, n: int) -> 'PynQuery[T]':
-        return PynQuery(take(self._iterable, n))
+        return self._then('take', take, n)
 
     def take_last(self, n: int) -> 'PynQuery[T]':
-        return PynQuery(take_last(self._iterable, n))
+        return self._then('take_last', take_last, n)
 
     def skip(self, n: int) -> 'PynQuery[T]':
-        return PynQuery(skip(self._iterable, n))
+        return self._then('skip', skip, n)
 
     def skip_last(self, n: int) -> 'PynQuery[T]':
-        return PynQuery(skip_last(self._iterable, n))
+        return self._then('skip_last', skip_last, n)
 
     # FILTER & TRANSFORM
 
     def where(self, predicate: Callable[[T], bool]) -> 'PynQuery[T]':
-        return PynQuery(where(self._iterable, predicate))
+        return self._then('where', where, predicate)
 
     def select(self, selector: Callable[[T], U]) -> 'PynQuery[U]':
-        return PynQuery(select(self._iterable, selector))
+        return self._then('select', select, selector)
+
+    def select_concurrent(self, selector: Callable[[T], U], max_workers: Optional[int] = None, max_in_flight: Optional[int] = None, ordered: bool = True) -> 'PynQuery[U]':
+        return self._then('select_concurrent', select_concurrent, selector, max_workers, max_in_flight, ordered)
 
     def select_many(self, key_selector: Callable[[T], Iterable[U]]) -> 'PynQuery[U]':
-        return PynQuery(select_many(self._iterable, key_selector))
+        return self._then('select_many', select_many, key_selector)
+
+    def with_min(self, predicate: Optional[Callable[[K], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> 'PynQuery[T]':
+        return self._then('with_min', with_min, predicate, key_selector)
+
+    def with_max(self, predicate: Optional[Callable[[K], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> 'PynQuery[T]':
+        return self._then('with_max', with_max, predicate, key_selector)
 
-    def with_min(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> 'PynQuery[T]':
-        return PynQuery(with_min(self._iterable, predicate, key_selector))
+    def min_by(self, key_selector: Callable[[T], K]) -> T:
+        return min_by(self._iterable, key_selector)
 
-    def with_max(self, predicate: Optional[Callable[[T], bool]] = None, key_selector: Optional[Callable[[T], K]] = None) -> 'PynQuery[T]':
-        return PynQuery(with_max(self._iterable, predicate, key_selector))
+    def max_by(self, key_selector: Callable[[T], K]) -> T:
+        return max_by(self._iterable, key_selector)
+
+    def min_max_by(self, key_selector: Callable[[T], K]) -> Tuple[T, T]:
+        return min_max_by(self._iterable, key_selector)
 
 
     # ADVANCED
 
-    def order_by(self, key_selector: Callable[[T], Any]) -> 'PynQuery[T]':
-        return PynQuery(order_by(self._iterable, key_selector))
+    def order_by(self, key_selector: Callable[[T], Any], memory_limit: Optional[int] = None) -> 'PynQuery[T]':
+        return self._then('order_by', order_by, key_selector, memory_limit)
+
+    def order_by_desc(self, key_selector: Callable[[T], Any], memory_limit: Optional[int] = None) -> 'PynQuery[T]':
+        return self._then('order_by_desc', order_by_desc, key_selector, memory_limit)
+
+    def then_by(self, key_selector: Callable[[T], Any]) -> 'PynQuery[T]':
+        return self._then_by(key_selector, False)
+
+    def then_by_desc(self, key_selector: Callable[[T], Any]) -> 'PynQuery[T]':
+        return self._then_by(key_selector, True)
+
+    def _then_by(self, key_selector: Callable[[T], Any], descending: bool) -> 'PynQuery[T]':
+        stages = self._plan.stages
+        if not stages or stages[-1].name not in ('order_by', 'order_by_desc', 'then_by'):
+            raise ValueError("then_by requires a preceding order_by or order_by_desc")
+        return self._then('then_by', order_by_keys, (key_selector, descending))
+
+    def group_by(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None, presorted: bool = False, memory_limit: Optional[int] = None) -> 'PynQuery[PynGrouping[K, U]]':
+        return self._then('group_by', _group_by, key_selector, value_selector, presorted, memory_limit)
+
+    def group_by_compact(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> 'PynQuery[PynGroupView[K, U]]':
+        return self._then('group_by_compact', group_by_compact, key_selector, value_selector)
+
+    def to_group_index(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> PynGroupIndex[K, U]:
+        return group_by_compact(self._iterable, key_selector, value_selector)
+
+    def group_adjacent(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> 'PynQuery[PynGrouping[K, U]]':
+        return self._then('group_adjacent', _group_by, key_selector, value_selector, True)
+
+    def group_aggregate(self, key_selector: Callable[[T], K], **aggregates: Any) -> 'PynQuery[Tuple[K, Dict[str, Any]]]':
+        return self._then('group_aggregate', _group_aggregate, key_selector, aggregates)
+
+    def join(self, inner: Iterable[U], outer_key_selector: Callable[[T], K], inner_key_selector: Callable[[U], K], result_selector: Optional[Callable[[T, U], Any]] = None, build: Optional[str] = None) -> 'PynQuery[Any]':
+        return self._then('join', join, inner, outer_key_selector, inner_key_selector, result_selector, build)
 
-    def order_by_desc(self, key_selector: Callable[[T], Any]) -> 'PynQuery[T]':
-        return PynQuery(order_by_desc(self._iterable, key_selector))
+    def left_join(self, inner: Iterable[U], outer_key_selector: Callable[[T], K], inner_key_selector: Callable[[U], K], result_selector: Optional[Callable[[T, Optional[U]], Any]] = None, default: Optional[U] = None, build: Optional[str] = None) -> 'PynQuery[Any]':
+        return self._then('left_join', left_join, inner, outer_key_selector, inner_key_selector, result_selector, default, build)
 
-    def group_by(self, key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None) -> 'PynQuery[PynGrouping[K, U]]':
-        return PynQuery(
-            PynGrouping(k, v)
-            for k, v in group_by(self._iterable, key_selector, value_selector)
-        )
+    def group_join(self, inner: Iterable[U], outer_key_selector: Callable[[T], K], inner_key_selector: Callable[[U], K], result_selector: Optional[Callable[[T, List[U]], Any]] = None) -> 'PynQuery[Any]':
+        return self._then('group_join', group_join, inner, outer_key_selector, inner_key_selector, result_selector)
+
+    def chunk(self, size: int) -> 'PynQuery[Sequence[T]]':
+        return self._then('chunk', chunk, size)
+
+    def batch_select(self, selector: Callable[[Sequence[T]], Iterable[U]], size: int) -> 'PynQuery[U]':
+        return self._then('batch_select', batch_select, selector, size)
 
     def aggregate(self, func: Callable[[U, T], U], seed: Optional[U] = None) -> U:
         return aggregate(self._iterable, func, seed)
 
-    def concatenate(self, *seqs: Iterable[T]) -> Iterable[T]:
-        return concatenate(self._iterable, seqs)
+    def concatenate(self, *seqs: Iterable[T]) -> 'PynQuery[T]':
+        return self._then('concatenate', concatenate, *seqs)
+
+
+    def explain(self) -> str:
+        return self._plan.explain()
+
+    def profile(self, hook: Optional[ProfileHook] = None) -> PynProfile:
+        return self._plan.profile(hook)
 
+    def memoize(self) -> 'PynQuery[T]':
+        return PynQuery(PynMemo(self._plan))
+
+    def as_parallel(self, workers: Optional[int] = None, chunk_size: int = 1024) -> PynParallelQuery[T]:
+        return PynParallelQuery(self, workers, chunk_size)
 
     # ALIASES
     toList = to_list
+    fromLines = from_lines
+    fromCsv = from_csv
+    fromJsonl = from_jsonl
+    toLookup = to_lookup
+    toDict = to_dict
     withMin = with_min
     withMax = with_max
+    minBy = min_by
+    maxBy = max_by
+    minMaxBy = min_max_by
     takeLast = take_last
     skipLast = skip_last
     selectMany = select_many
+    selectConcurrent = select_concurrent
     containsAll = contains_all
+    aggregateMany = aggregate_many
+    distinctBy = distinct_by
+    unionBy = union_by
+    intersectBy = intersect_by
+    exceptBy = except_by
     firstOrDefault = first_or_default
     lastOrDefault = last_or_default
     orderByDesc = order_by_desc
     orderBy = order_by
+    thenBy = then_by
+    thenByDesc = then_by_desc
     groupBy = group_by
+    groupAdjacent = group_adjacent
+    groupByCompact = group_by_compact
+    toGroupIndex = to_group_index
+    groupAggregate = group_aggregate
+    leftJoin = left_join
+    groupJoin = group_join
+    batchSelect = batch_select
+    asParallel = as_parallel
+    buffered = memoize
+
+
+# PRIVATE
+
+def _group_by(seq: Iterable[T], key_selector: Callable[[T], K], value_selector: Optional[Callable[[T], U]] = None, presorted: bool = False, memory_limit: Optional[int] = None) -> Iterator[PynGrouping[K, U]]:
+    return (PynGrouping(k, v) for k, v in group_by(seq, key_selector, value_selector, presorted, memory_limit))
+
+def _group_aggregate(seq: Iterable[T], key_selector: Callable[[T], K], aggregates: Dict[str, Any]) -> Iterable[Tuple[K, Dict[str, Any]]]:
+    return group_aggregate(seq, key_selector, **aggregates)
 
 
 if __name__ == '__main__':
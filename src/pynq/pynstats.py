@@ -0,0 +1,19 @@
+# pynq/pynstats.py
+from typing import Any, NamedTuple, Optional
+
+
+class PynStats(NamedTuple):
+    count: int
+    sum: Any
+    min: Any
+    max: Any
+    avg: Optional[float]
+    variance: Any
+    stddev: Any
+
+    def as_dict(self) -> dict:
+        return self._asdict()
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.PynStats!')
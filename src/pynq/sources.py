@@ -0,0 +1,103 @@
+# pynq/sources.py
+from typing import Callable, Iterable, Optional
+from typing import Any, Dict, List, Iterator, Sequence, Union
+import csv
+import json
+import mmap
+import os
+import re
+
+
+BUFFER_SIZE = 1 << 20
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+_NEWLINE = re.compile(rb'\r\n?|\n')
+
+
+class FileSource(Iterable[Any]):
+
+    def __init__(self, reader: Callable[..., Iterator[Any]], *args: Any, **kwargs: Any):
+        self._reader = reader
+        self._args = args
+        self._kwargs = kwargs
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._reader(*self._args, **self._kwargs)
+
+
+def read_lines(path: PathLike, encoding: str = 'utf-8', use_mmap: bool = False, buffer_size: int = BUFFER_SIZE) -> Iterator[str]:
+    if use_mmap:
+        yield from _read_lines_mmap(path, encoding)
+        return
+    with open(path, 'r', encoding=encoding, newline='', buffering=buffer_size) as f:
+        for line in f:
+            yield _strip_newline(line)
+
+def read_csv(path: PathLike, columns: Optional[Sequence[Union[str, int]]] = None, converters: Optional[Dict[Union[str, int], Callable[[str], Any]]] = None, header: bool = True, delimiter: str = ',', encoding: str = 'utf-8', buffer_size: int = BUFFER_SIZE) -> Iterator[Dict[Union[str, int], Any]]:
+    converters = converters or {}
+    with open(path, 'r', encoding=encoding, newline='', buffering=buffer_size) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        names: List[Union[str, int]] = list(next(reader, [])) if header else []
+        projection = None
+        width = 0
+        for row in reader:
+            if not row:
+                continue
+            if projection is None:
+                if not names:
+                    names = list(range(len(row)))
+                projection = _projection(names, columns, converters)
+                width = max((i + 1 for _, i, _ in projection), default=0)
+            if len(row) < width:
+                row = row + [None] * (width - len(row))
+            yield {name: convert(row[i]) if convert and row[i] is not None else row[i] for name, i, convert in projection}
+
+def read_jsonl(path: PathLike, fields: Optional[Sequence[str]] = None, encoding: str = 'utf-8', buffer_size: int = BUFFER_SIZE) -> Iterator[Any]:
+    with open(path, 'r', encoding=encoding, buffering=buffer_size) as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if fields is None:
+                yield record
+            elif isinstance(record, dict):
+                yield {field: record.get(field) for field in fields}
+            else:
+                raise ValueError(f"Line {number}: cannot select fields from a JSON {type(record).__name__}")
+
+
+# PRIVATE
+
+def _strip_newline(line: str) -> str:
+    if line.endswith('\n'):
+        line = line[:-1]
+    if line.endswith('\r'):
+        line = line[:-1]
+    return line
+
+def _read_lines_mmap(path: PathLike, encoding: str) -> Iterator[str]:
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            for match in _NEWLINE.finditer(mm):
+                yield mm[start:match.start()].decode(encoding)
+                start = match.end()
+            if start < len(mm):
+                yield mm[start:].decode(encoding)
+
+def _projection(names: List[Union[str, int]], columns: Optional[Sequence[Union[str, int]]], converters: Dict[Union[str, int], Callable[[str], Any]]) -> List[Any]:
+    if columns is None:
+        columns = names
+    projection = []
+    for column in columns:
+        if column not in names:
+            raise KeyError(f"Unknown column: {column!r}")
+        projection.append((column, names.index(column), converters.get(column)))
+    return projection
+
+
+if __name__ == '__main__':
+    print('Hello PYNQ.sources!')
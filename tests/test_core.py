@@ -1,21 +1,30 @@
 # tests/test_pynq.py
 import unittest
 from pynq.core import (
-    to_list,
-    where, distinct,
+    to_list, has_any,
+    where, distinct, distinct_by,
+    union, union_by,
+    intersect, intersect_by,
+    except_, except_by,
     sum_of, avg_of,
     min_of, max_of,
+    stats, aggregate_many,
     with_min, with_max,
+    min_by, max_by, min_max_by,
     has, count as cnt,
-    select, select_many,
+    select, select_many, select_concurrent,
     last, last_or_default,
     first, first_or_default,
     contains, contains_all,
     take, take_last,
     skip, skip_last,
     order_by, order_by_desc,
+    order_by_keys,
+    take_ordered, take_ordered_desc, take_ordered_keys,
     aggregate, concatenate,
-    group_by
+    chunk, batch_select,
+    group_by, group_by_compact, group_adjacent, group_aggregate,
+    join, left_join, group_join
 )
 
 
@@ -28,6 +37,7 @@ class TestPYNQ(unittest.TestCase):
         self.integers = test_data["integers"]
         self.dictionary = test_data["dictionary"]
         self.nested_dict = test_data["nested_dict"]
+        self.films = test_data["films"]
 
 
     def test_to_list(self):
@@ -105,6 +115,92 @@ class TestPYNQ(unittest.TestCase):
         self.assertEqual(result_max, expected_max)
         self.assertEqual(result_filtered_max, expected_filtered_max)
 
+    def test_with_min(self):
+        # Arrange:
+        selector = lambda x: x["year"]
+        expected_result = [self.dictionary[4]]
+        expected_filtered = [self.dictionary[5]]
+        # Act:
+        result = with_min(iter(self.dictionary), key_selector=selector)
+        result_filtered = with_min(self.dictionary, lambda x: x > 41, selector)
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(result_filtered, expected_filtered)
+        self.assertEqual(with_min(self.empty), [])
+
+    def test_with_max(self):
+        # Arrange:
+        selector = lambda x: x["year"]
+        expected_result = [self.dictionary[0], self.dictionary[3]]
+        # Act:
+        result = with_max(iter(self.dictionary), key_selector=selector)
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(with_max(self.integers), [5])
+
+    def test_min_max_by(self):
+        # Arrange:
+        selector = lambda x: x["year"]
+        # Act:
+        result_min = min_by(self.dictionary, selector)
+        result_max = max_by(self.dictionary, selector)
+        result_both = min_max_by(iter(self.dictionary), selector)
+        # Assert:
+        self.assertEqual(result_min["name"], "JohnC")
+        self.assertEqual(result_max["name"], "MichaelP")
+        self.assertEqual(result_both, (result_min, result_max))
+        self.assertRaises(ValueError, min_max_by, self.empty, selector)
+
+    def test_stats(self):
+        # Arrange:
+        import statistics
+        values = [x * 0.5 for x in self.integers]
+        # Act:
+        result = stats(iter(self.integers), lambda x: x * 0.5)
+        result_sample = stats(self.integers, ddof=1)
+        result_empty = stats(self.empty)
+        # Assert:
+        self.assertEqual((result.count, result.sum, result.min, result.max), (7, 10.0, 0.5, 2.5))
+        self.assertAlmostEqual(result.avg, statistics.mean(values))
+        self.assertAlmostEqual(result.variance, statistics.pvariance(values))
+        self.assertAlmostEqual(result.stddev, statistics.pstdev(values))
+        self.assertAlmostEqual(result_sample.variance, statistics.variance(self.integers))
+        self.assertEqual(result_empty.as_dict(), {"count": 0, "sum": 0, "min": None, "max": None, "avg": None, "variance": None, "stddev": None})
+
+    def test_stats_stable(self):
+        # Arrange:
+        values = [1e9 + x for x in (4, 7, 13, 16)]
+        # Act:
+        result = stats(values)
+        # Assert:
+        self.assertAlmostEqual(result.variance, 22.5)
+
+    def test_stats_decimal(self):
+        # Arrange:
+        from decimal import Decimal
+        values = [Decimal("1.5"), Decimal("2.5"), Decimal("4.0")]
+        # Act:
+        result = stats(values)
+        result_many = aggregate_many(values, spread=("variance", None), dev=("stddev", None))
+        # Assert:
+        self.assertEqual(result.avg, Decimal("2.666666666666666666666666667"))
+        self.assertIsInstance(result.variance, Decimal)
+        self.assertEqual(result.variance, result_many["spread"])
+        self.assertEqual(result.stddev, result_many["dev"])
+
+    def test_aggregate_many(self):
+        # Arrange:
+        import statistics
+        year = lambda x: x["year"]
+        # Act:
+        result = aggregate_many(iter(self.dictionary), n="count", oldest=("max", year), spread=("variance", year))
+        result_empty = aggregate_many(self.empty, n="count", top="max")
+        # Assert:
+        self.assertEqual(result["n"], 6)
+        self.assertEqual(result["oldest"], 43)
+        self.assertAlmostEqual(result["spread"], statistics.pvariance([x["year"] for x in self.dictionary]))
+        self.assertEqual(result_empty, {"n": 0, "top": None})
+
     def test_where(self):
         # Arrange:
         expected_result = [2, 4, 2]
@@ -122,6 +218,42 @@ class TestPYNQ(unittest.TestCase):
         # Assert:
         self.assertEqual(result, expected_result)
 
+    def test_distinct_by(self):
+        # Act:
+        result = list(distinct_by(self.strings, lambda s: s[0]))
+        # Assert:
+        self.assertEqual(result, ["apple", "banana"])
+
+    def test_union(self):
+        # Act:
+        result = list(union(iter(self.integers), [7, 1, 6, 7]))
+        result_by = list(union_by(self.strings, ["cherry", "apricot"], lambda s: s[0]))
+        # Assert:
+        self.assertEqual(result, [1, 2, 3, 4, 5, 7, 6])
+        self.assertEqual(result_by, ["apple", "banana", "cherry"])
+
+    def test_intersect(self):
+        # Act:
+        result = list(intersect(self.integers, iter([3, 9, 2, 3])))
+        result_by = list(intersect_by(self.strings, ["brie", "cheddar"], lambda s: s[0]))
+        # Assert:
+        self.assertEqual(result, [2, 3])
+        self.assertEqual(result_by, ["banana"])
+
+    def test_except(self):
+        # Act:
+        result = list(except_(self.integers, [2, 4]))
+        result_by = list(except_by(self.strings, ["brie"], lambda s: s[0]))
+        # Assert:
+        self.assertEqual(result, [1, 3, 5])
+        self.assertEqual(result_by, ["apple"])
+
+    def test_contains_set(self):
+        self.assertTrue(contains({1, 2}, 2))
+        self.assertFalse(contains((x for x in self.integers), 10))
+        self.assertFalse(contains({1, 2}, [1]))
+        self.assertTrue(contains({1: "a", (2,): "b"}, (2,)))
+
     def test_select(self):
         # Arrange:
         expected_result = [i * 2 for i in self.integers]
@@ -141,6 +273,45 @@ class TestPYNQ(unittest.TestCase):
         # Assert:
         self.assertEqual(result, expected_result)
 
+    def test_select_concurrent(self):
+        # Arrange:
+        expected_result = [i * 2 for i in self.integers]
+        # Act:
+        result = list(select_concurrent(self.integers, lambda x: x * 2, max_workers=3))
+        result_unordered = list(select_concurrent(iter(self.integers), lambda x: x * 2, ordered=False))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(sorted(result_unordered), sorted(expected_result))
+
+    def test_select_concurrent_raises(self):
+        # Arrange:
+        def selector(x):
+            if x == 4:
+                raise KeyError(x)
+            return x
+        # Act:
+        results = select_concurrent(self.integers, selector, max_workers=2)
+        # Assert:
+        self.assertEqual(next(results), 1)
+        self.assertRaises(KeyError, list, results)
+
+    def test_select_concurrent_bounded(self):
+        # Arrange:
+        import threading
+        lock = threading.Lock()
+        calls = []
+        def selector(x):
+            with lock:
+                calls.append(x)
+            return x
+        # Act:
+        results = select_concurrent(range(1000), selector, max_workers=2, max_in_flight=4)
+        result = list(take(results, 3))
+        results.close()
+        # Assert:
+        self.assertEqual(result, [0, 1, 2])
+        self.assertLessEqual(len(calls), 8)
+
     def test_last(self):
         # Arrange:
         expected_result = 3
@@ -219,6 +390,29 @@ class TestPYNQ(unittest.TestCase):
         # Assert:
         self.assertEqual(result, expected_result)
 
+    def test_take_last_generator(self):
+        # Arrange:
+        expected_result = self.integers[-3:]
+        # Act:
+        result = list(take_last((x for x in self.integers), 3))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(list(take_last(self.integers, 10)), self.integers)
+        self.assertEqual(list(take_last(self.integers, 0)), [])
+
+    def test_skip_last_generator(self):
+        # Arrange:
+        expected_result = self.integers[:-2]
+        # Act:
+        result = list(skip_last((x for x in self.integers), 2))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(list(skip_last(self.integers, 10)), [])
+        self.assertEqual(list(skip_last(range(5), 2)), [0, 1, 2])
+
+    def test_count_falsy(self):
+        self.assertEqual(cnt([0, "", None, 1]), 4)
+
     def test_contains(self):
         # Arrange:
         value_to_check = 4
@@ -257,6 +451,70 @@ class TestPYNQ(unittest.TestCase):
         # Assert:
         self.assertEqual(result, expected_result)
 
+    def test_order_by_keys(self):
+        # Arrange:
+        records = [(t, p, ts) for ts, (t, p) in enumerate([("b", 1), ("a", 2), ("b", 3), ("a", 2), ("a", 5)])]
+        expected_result = sorted(records, key=lambda r: (r[0], -r[1], r[2]))
+        keys = ((lambda r: r[0], False), (lambda r: r[1], True), (lambda r: r[2], False))
+        # Act:
+        result = order_by_keys(iter(records), keys)
+        result_top = take_ordered_keys(iter(records), 2, keys)
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(result_top, expected_result[:2])
+
+    def test_order_by_keys_same_direction(self):
+        # Arrange:
+        keys = ((lambda x: x["year"], True), (lambda x: x["name"], True))
+        expected_result = sorted(self.dictionary, key=lambda x: (x["year"], x["name"]), reverse=True)
+        # Act:
+        result = order_by_keys(self.dictionary, keys)
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(take_ordered_keys(self.dictionary, 3, keys), expected_result[:3])
+
+    def test_order_by_memory_limit(self):
+        # Arrange:
+        import random
+        rng = random.Random(1269)
+        records = [(rng.randrange(50), i) for i in range(2000)]
+        # Act:
+        result = list(order_by(iter(records), lambda r: r[0], memory_limit=128))
+        result_desc = list(order_by_desc(records, lambda r: r[0], memory_limit=333))
+        result_small = list(order_by(self.integers, lambda x: x, memory_limit=100))
+        # Assert:
+        self.assertEqual(result, sorted(records, key=lambda r: r[0]))
+        self.assertEqual(result_desc, sorted(records, key=lambda r: r[0], reverse=True))
+        self.assertEqual(result_small, sorted(self.integers))
+        self.assertEqual(list(order_by(self.empty, len, memory_limit=1)), [])
+        self.assertRaises(ValueError, order_by, self.integers, len, 0)
+
+    def test_order_by_keys_memory_limit(self):
+        # Arrange:
+        keys = ((lambda x: x["year"], True), (lambda x: x["name"], False))
+        # Act:
+        result = list(order_by_keys(self.dictionary, keys, memory_limit=2))
+        # Assert:
+        self.assertEqual(result, sorted(self.dictionary, key=lambda x: (-x["year"], x["name"])))
+
+    def test_take_ordered(self):
+        # Arrange:
+        selector = lambda x: x["year"]
+        expected_result = order_by(self.dictionary, selector)[:3]
+        # Act:
+        result = take_ordered(iter(self.dictionary), 3, selector)
+        # Assert:
+        self.assertEqual(result, expected_result)
+
+    def test_take_ordered_desc(self):
+        # Arrange:
+        selector = lambda x: x["year"]
+        expected_result = order_by_desc(self.dictionary, selector)[:3]
+        # Act:
+        result = take_ordered_desc(iter(self.dictionary), 3, selector)
+        # Assert:
+        self.assertEqual(result, expected_result)
+
     def test_concatenate(self):
         # Arrange:
         additional_elements = [6, 7, 8]
@@ -266,6 +524,58 @@ class TestPYNQ(unittest.TestCase):
         # Assert:
         self.assertEqual(result, expected_result)
 
+    def test_chunk(self):
+        # Arrange:
+        expected_result = [[1, 2, 3], [4, 5, 2], [3]]
+        # Act:
+        result_list = list(chunk(self.integers, 3))
+        result_generator = list(chunk((x for x in self.integers), 3))
+        result_range = list(chunk(range(7), 3))
+        # Assert:
+        self.assertEqual(result_list, expected_result)
+        self.assertEqual(result_generator, expected_result)
+        self.assertEqual(result_range, [range(0, 3), range(3, 6), range(6, 7)])
+        self.assertRaises(ValueError, chunk, self.integers, 0)
+
+    def test_chunk_views(self):
+        # Arrange:
+        data = bytearray(b"abcdefg")
+        values = list(range(10))
+        # Act:
+        views = list(chunk(memoryview(data), 4))
+        data[0] = ord("z")
+        slices = list(chunk(values, 4))
+        values[9] = 99
+        # Assert:
+        self.assertEqual(views[0].tobytes(), b"zbcd")
+        self.assertEqual(list(slices[2]), [8, 99])
+        self.assertEqual((len(slices[1]), slices[1][0], slices[1][-1], slices[1][1:3]), (4, 4, 7, [5, 6]))
+
+    def test_chunk_late_view_indexes_directly(self):
+        # Arrange:
+        class Recording(list):
+            def __getitem__(self, index):
+                touched.append(index)
+                return super().__getitem__(index)
+        touched = []
+        values = Recording(range(100000))
+        # Act:
+        last_chunk = list(chunk(values, 5000))[-1]
+        result = list(last_chunk)
+        # Assert:
+        self.assertEqual(result, list(range(95000, 100000)))
+        self.assertEqual(touched, list(range(95000, 100000)))
+
+    def test_batch_select(self):
+        # Arrange:
+        batches = []
+        selector = lambda batch: batches.append(len(batch)) or [sum(batch)]
+        # Act:
+        result = list(batch_select(iter(self.integers), selector, 3))
+        # Assert:
+        self.assertEqual(result, [6, 11, 3])
+        self.assertEqual(batches, [3, 3, 1])
+
     def test_aggregate(self):
         # Arrange:
         expected_result = 1
@@ -287,6 +597,196 @@ class TestPYNQ(unittest.TestCase):
         # Assert:
         self.assertEqual(result, expected_result)
 
+    def test_group_by_memory_limit(self):
+        # Arrange:
+        records = [(i % 97, i) for i in range(3000)]
+        expected_result = sorted((k, sorted(v)) for k, v in group_by(records, lambda r: r[0], lambda r: r[1]))
+        # Act:
+        result = list(group_by(iter(records), lambda r: r[0], lambda r: r[1], memory_limit=100))
+        result_small = list(group_by(self.strings, lambda s: s[0], memory_limit=100))
+        # Assert:
+        self.assertEqual(sorted((k, sorted(v)) for k, v in result), expected_result)
+        self.assertEqual(len(result), 97)
+        self.assertEqual(result_small, list(group_by(self.strings, lambda s: s[0])))
+        self.assertRaises(ValueError, group_by, self.strings, len, None, False, 0)
+
+    def test_take_last_skip_last_deque(self):
+        # Arrange:
+        from collections import deque
+        values = deque(self.integers)
+        # Act & Assert:
+        self.assertEqual(list(take_last(values, 2)), [2, 3])
+        self.assertEqual(list(skip_last(values, 5)), [1, 2])
+
+    def test_group_by_memory_limit_skewed_keys(self):
+        # Arrange:
+        records = [(16 * (i % 100), i) for i in range(2000)]
+        single = [("k", i) for i in range(500)]
+        # Act:
+        result = dict(group_by(records, lambda r: r[0], lambda r: r[1], memory_limit=50))
+        result_single = list(group_by(single, lambda r: r[0], lambda r: r[1], memory_limit=50))
+        # Assert:
+        self.assertEqual(len(result), 100)
+        self.assertEqual(result[16], list(range(1, 2000, 100)))
+        self.assertEqual(result_single, [("k", list(range(500)))])
+
+    def test_group_by_memory_limit_colliding_hashes(self):
+        # Arrange:
+        seq = [-1, -2] * 150
+        # Act:
+        result = dict(group_by(seq, lambda x: x, memory_limit=50))
+        # Assert:
+        self.assertEqual(result, {-1: [-1] * 150, -2: [-2] * 150})
+
+    def test_group_by_memory_limit_keeps_value_order(self):
+        # Act:
+        result = dict(group_by(range(1000), lambda x: x % 3, memory_limit=10))
+        # Assert:
+        self.assertEqual(result[1], list(range(1, 1000, 3)))
+
+    def test_group_adjacent(self):
+        # Arrange:
+        seq = ["a1", "a2", "b1", "a3", "c1", "c2"]
+        expected_result = [("a", ["1", "2"]), ("b", ["1"]), ("a", ["3"]), ("c", ["1", "2"])]
+        # Act:
+        result = list(group_adjacent(iter(seq), lambda s: s[0], lambda s: s[1]))
+        result_presorted = list(group_by(iter(seq), lambda s: s[0], lambda s: s[1], presorted=True))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(result_presorted, expected_result)
+
+    def test_group_adjacent_is_streaming(self):
+        # Arrange:
+        pulled = []
+        source = (pulled.append(x) or x for x in [1, 1, 2, 3, 3])
+        # Act:
+        groups = group_adjacent(source, lambda x: x)
+        first_group = next(groups)
+        # Assert:
+        self.assertEqual(first_group, (1, [1, 1]))
+        self.assertEqual(pulled, [1, 1, 2])
+
+    def test_group_aggregate(self):
+        # Arrange:
+        year = lambda x: x["year"]
+        expected_result = [
+            ("M", {"n": 1, "total": 43, "low": 43, "high": 43, "mean": 43.0, "names": "MichaelP"}),
+            ("G", {"n": 1, "total": 41, "low": 41, "high": 41, "mean": 41.0, "names": "GrahamC"}),
+            ("T", {"n": 2, "total": 82, "low": 40, "high": 42, "mean": 41.0, "names": "TerryG,TerryJ"}),
+            ("E", {"n": 1, "total": 43, "low": 43, "high": 43, "mean": 43.0, "names": "EricI"}),
+            ("J", {"n": 1, "total": 39, "low": 39, "high": 39, "mean": 39.0, "names": "JohnC"}),
+        ]
+        # Act:
+        result = list(group_aggregate(
+            iter(self.dictionary), lambda x: x["name"][0],
+            n="count", total=("sum", year), low=("min", year), high=("max", year), mean=("mean", year),
+            names=(lambda acc, name: acc + "," + name if acc else name, lambda x: x["name"], ""),
+        ))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertRaises(ValueError, list, group_aggregate(self.integers, bool, bad=("median", None)))
+
+    def test_group_aggregate_unseeded_callable(self):
+        # Arrange:
+        year = lambda x: x["year"]
+        # Act:
+        result = dict(group_aggregate(iter(self.dictionary), lambda x: x["name"][0], oldest=(max, year)))
+        result_bare = dict(group_aggregate(self.integers, lambda x: x % 2, top=max))
+        result_empty = aggregate_many(self.empty, top=max)
+        # Assert:
+        self.assertEqual(result["T"], {"oldest": 42})
+        self.assertEqual(result_bare, {1: {"top": 5}, 0: {"top": 4}})
+        self.assertEqual(result_empty, {"top": None})
+
+    def test_join(self):
+        # Arrange:
+        expected_result = [(p["name"], f["title"]) for p in self.dictionary for f in self.films if p["name"] == f["director"]]
+        selector = lambda p, f: (p["name"], f["title"])
+        # Act:
+        result = list(join(iter(self.dictionary), self.films, lambda p: p["name"], lambda f: f["director"], selector))
+        result_outer = list(join(self.dictionary, iter(self.films), lambda p: p["name"], lambda f: f["director"], selector, build="outer"))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(sorted(result_outer), sorted(expected_result))
+        self.assertRaises(ValueError, list, join(self.dictionary, self.films, len, len, build="left"))
+
+    def test_join_composite_key(self):
+        # Arrange:
+        left = [(1, "a", "x"), (1, "b", "y"), (2, "a", "z")]
+        right = [(1, "a", 10), (2, "a", 20), (2, "b", 30)]
+        keys = (lambda r: r[0], lambda r: r[1])
+        # Act:
+        result = list(join(left, right, keys, keys, lambda l, r: (l[2], r[2])))
+        # Assert:
+        self.assertEqual(result, [("x", 10), ("z", 20)])
+
+    def test_left_join(self):
+        # Arrange:
+        name = lambda p: p["name"]
+        director = lambda f: f["director"]
+        selector = lambda p, f: (p["name"], f and f["title"])
+        expected_result = [("MichaelP", None), ("GrahamC", None), ("TerryG", "Holy Grail"), ("TerryG", "Brazil"),
+                           ("EricI", None), ("JohnC", None), ("TerryJ", "Life of Brian"), ("TerryJ", "Meaning of Life")]
+        # Act:
+        result = list(left_join(self.dictionary, self.films, name, director, selector))
+        result_outer = list(left_join(self.dictionary, self.films, name, director, selector, build="outer"))
+        # Assert:
+        self.assertEqual(result, expected_result)
+        self.assertEqual(sorted(result_outer, key=str), sorted(expected_result, key=str))
+
+    def test_left_join_small_outer_keeps_order(self):
+        # Arrange:
+        outer = [3, 1, 2]
+        inner = [1, 1, 2, 4, 5, 6]
+        # Act:
+        result = list(left_join(outer, inner, lambda x: x, lambda x: x))
+        # Assert:
+        self.assertEqual(result, [(3, None), (1, 1), (1, 1), (2, 2)])
+
+    def test_group_join(self):
+        # Act:
+        result = list(group_join(self.dictionary, self.films, lambda p: p["name"], lambda f: f["director"], lambda p, fs: (p["name"], len(fs))))
+        # Assert:
+        self.assertEqual(result, [("MichaelP", 0), ("GrahamC", 0), ("TerryG", 2), ("EricI", 0), ("JohnC", 0), ("TerryJ", 2)])
+
+    def test_sequence_fast_paths(self):
+        # Arrange:
+        huge = range(10 ** 15)
+        mapping = {"a": 1, "b": 2, "c": None}
+        # Act & Assert:
+        self.assertEqual(cnt(huge), 10 ** 15)
+        self.assertEqual(last(huge), 10 ** 15 - 1)
+        self.assertEqual(last(huge, lambda x: x % 7 == 0), 10 ** 15 - 1 - (10 ** 15 - 1) % 7)
+        self.assertEqual(take(skip(huge, 10 ** 14), 2), range(10 ** 14, 10 ** 14 + 2))
+        self.assertEqual(cnt(mapping.values()), 3)
+        self.assertEqual(last(mapping.items()), ("c", None))
+        self.assertIsNone(last(mapping.values()))
+        self.assertFalse(has_any(set()))
+        self.assertEqual(last_or_default(mapping.keys(), lambda k: k > "z", "-"), "-")
+        self.assertEqual(take(self.integers, 2), [1, 2])
+        self.assertEqual(skip(tuple(self.integers), 5), (2, 3))
+
+    def test_group_by_compact(self):
+        # Arrange:
+        expected_result = [(key, list(values)) for key, values in group_by(self.strings, lambda s: s[0])]
+        # Act:
+        result = group_by_compact(self.strings, lambda s: s[0])
+        result_values = group_by_compact(iter(self.integers), lambda x: x % 2, lambda x: x * 10)
+        # Assert:
+        self.assertEqual([g.as_tuple() for g in result], expected_result)
+        self.assertEqual(result.keys(), [k for k, _ in expected_result])
+        self.assertEqual(list(result.sizes()), [len(v) for _, v in expected_result])
+        self.assertEqual(list(result_values.group(0)), [20, 40, 20])
+        self.assertEqual(result_values.group(1)[-1], 30)
+        self.assertEqual(len(result_values.get(1)), 4)
+        self.assertIsNone(result_values.get(2))
+        self.assertTrue(result_values.has_key(1))
+        self.assertFalse(result_values.has_key(2))
+        self.assertNotIn(1, result_values)
+        self.assertIn(result_values[0], result_values)
+        self.assertEqual(list(result_values.offsets), [0, 4, 7])
+        self.assertEqual(len(group_by_compact(self.empty, lambda x: x)), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
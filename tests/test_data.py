@@ -12,6 +12,13 @@ test_data = {
         { "name": "JohnC", "year": 39 },
         { "name": "TerryJ", "year": 42 },
     ],
+    "films": [
+        { "title": "Holy Grail", "director": "TerryG", "year": 1975 },
+        { "title": "Life of Brian", "director": "TerryJ", "year": 1979 },
+        { "title": "Meaning of Life", "director": "TerryJ", "year": 1983 },
+        { "title": "Brazil", "director": "TerryG", "year": 1985 },
+        { "title": "Fierce Creatures", "director": "Fred S", "year": 1997 },
+    ],
     "nested_dict": [
         { "id": 1, "people": [ { "name": "Bob" }, { "name": "James" } ] },
         { "id": 2, "people": [ { "name": "Harry" }, { "name": "Mikey" } ] }
@@ -0,0 +1,112 @@
+# tests/test_numeric.py
+import unittest
+from array import array
+from pynq.numeric import has_numpy, reduce_sum, reduce_avg, reduce_min, reduce_max
+from pynq.core import sum_of, avg_of, min_of, max_of
+from pynq.pynquery import PynQuery
+
+
+class TestNumeric(unittest.TestCase):
+
+    def test_reduce_empty(self):
+        self.assertEqual(reduce_sum([]), 0)
+        self.assertIsNone(reduce_avg(iter([])))
+        self.assertIsNone(reduce_min([]))
+        self.assertIsNone(reduce_max(array('d')))
+
+    def test_falsy_values(self):
+        # Arrange:
+        values = [0, -1, 3, 0]
+        # Act & Assert:
+        self.assertEqual(min_of(values), -1)
+        self.assertEqual(max_of([0, -1]), 0)
+        self.assertEqual(avg_of(values), 0.5)
+
+    def test_selector_called_once(self):
+        # Arrange:
+        calls = []
+        selector = lambda x: calls.append(x) or x * 2
+        # Act:
+        result = sum_of([1, 2, 3], lambda x: x > 2, selector)
+        # Assert:
+        self.assertEqual(result, 10)
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_float_stream(self):
+        # Arrange:
+        values = [0.5] * 100001
+        # Act & Assert:
+        self.assertEqual(reduce_sum(iter(values)), 50000.5)
+        self.assertEqual(reduce_avg(iter(values)), 0.5)
+        self.assertEqual(PynQuery(range(10)).select(float).sum(), 45.0)
+
+    def test_float_stream_keeps_python_semantics(self):
+        # Arrange:
+        from decimal import Decimal
+        # Act & Assert:
+        self.assertRaises(TypeError, reduce_sum, iter([1.5, None]))
+        self.assertRaises(TypeError, reduce_avg, iter([1.5, None]))
+        self.assertEqual(reduce_sum(iter([Decimal("0.1"), Decimal("0.2")])), Decimal("0.3"))
+
+    def test_array_sources(self):
+        # Arrange:
+        ints = array('q', [3, -2, 7, 0])
+        floats = array('d', [1.5, 2.5])
+        # Act & Assert:
+        self.assertEqual(reduce_sum(ints), 8)
+        self.assertEqual(reduce_min(ints), -2)
+        self.assertEqual(reduce_max(memoryview(ints)), 7)
+        self.assertEqual(reduce_avg(floats), 2.0)
+        self.assertEqual(PynQuery(floats).sum(), 4.0)
+
+    def test_array_sum_overflow(self):
+        # Arrange:
+        big = array('q', [2 ** 62, 2 ** 62, 2 ** 62])
+        # Act & Assert:
+        self.assertEqual(reduce_sum(big), 3 * 2 ** 62)
+
+    @unittest.skipUnless(has_numpy(), "numpy is not installed")
+    def test_ndarray_source(self):
+        import numpy as np
+        # Arrange:
+        values = np.arange(1, 101, dtype=np.int32)
+        # Act & Assert:
+        self.assertEqual(reduce_sum(values), 5050)
+        self.assertIsInstance(reduce_sum(values), int)
+        self.assertEqual(reduce_min(values), 1)
+        self.assertEqual(reduce_max(values), 100)
+        self.assertEqual(PynQuery(values).avg(), 50.5)
+
+    @unittest.skipUnless(has_numpy(), "numpy is not installed")
+    def test_ndarray_filtered_returns_python_scalars(self):
+        import numpy as np
+        # Arrange:
+        values = np.arange(1, 11, dtype=np.int32)
+        even = lambda x: x % 2 == 0
+        # Act:
+        total = sum_of(values, even)
+        query_total = PynQuery(values).where(even).sum()
+        average = avg_of(values, even)
+        lowest = PynQuery(values).where(even).min()
+        # Assert:
+        self.assertEqual((total, query_total, average, lowest), (30, 30, 6.0, 2))
+        self.assertIs(type(total), int)
+        self.assertIs(type(query_total), int)
+        self.assertIs(type(average), float)
+        self.assertIs(type(lowest), int)
+
+    @unittest.skipUnless(has_numpy(), "numpy is not installed")
+    def test_ndarray_chunks_are_views(self):
+        import numpy as np
+        from pynq.core import chunk
+        # Arrange:
+        values = np.arange(10)
+        # Act:
+        chunks = list(chunk(values, 4))
+        # Assert:
+        self.assertEqual([len(c) for c in chunks], [4, 4, 2])
+        self.assertTrue(all(np.shares_memory(c, values) for c in chunks))
+
+
+if __name__ == '__main__':
+    unittest.main()
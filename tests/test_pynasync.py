@@ -0,0 +1,86 @@
+# tests/test_pynasync.py
+import asyncio
+import unittest
+from pynq.core import aggregate
+from pynq.pynasync import AsyncPynQuery
+from .test_data import test_data
+
+
+async def produce(items):
+    for x in items:
+        await asyncio.sleep(0)
+        yield x
+
+async def async_double(x):
+    await asyncio.sleep(0)
+    return x * 2
+
+
+class TestAsyncPynQuery(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.integers = AsyncPynQuery(produce(test_data["integers"]))
+        self.strings = AsyncPynQuery(test_data["strings"])
+
+    async def test_where_select_take(self):
+        result = await self.integers.where(lambda x: x > 1).select(async_double).take(3).to_list()
+        self.assertEqual(result, [4, 6, 8])
+
+    async def test_sync_source_reiterable(self):
+        self.assertEqual(await self.strings.count(), 4)
+        self.assertEqual(await self.strings.first(lambda s: s.startswith("b")), "banana")
+
+    async def test_aggregates(self):
+        query = AsyncPynQuery(test_data["integers"])
+        self.assertEqual(await query.sum(), 20)
+        self.assertEqual(await query.min(), 1)
+        self.assertEqual(await query.max(lambda x: x % 2 == 0), 4)
+        self.assertEqual(await query.avg(), sum(test_data["integers"]) / 7)
+        self.assertEqual(await query.aggregate(lambda a, b: a * b), 720)
+        self.assertTrue(await query.contains(5))
+        self.assertIsNone(await AsyncPynQuery([]).first_or_default())
+
+    async def test_aggregate_none_result(self):
+        func = lambda a, b: None if b == 1 else ("acc", a, b)
+        self.assertEqual(await AsyncPynQuery([0, 1, 2]).aggregate(func), aggregate([0, 1, 2], func))
+        self.assertEqual(await AsyncPynQuery([0, 1, 2]).aggregate(func), ("acc", None, 2))
+        with self.assertRaises(TypeError):
+            await AsyncPynQuery([]).aggregate(func)
+
+    async def test_select_many_and_distinct(self):
+        people = AsyncPynQuery(produce(test_data["nested_dict"])).select_many(lambda x: produce(x["people"]))
+        self.assertEqual(await people.select(lambda p: p["name"]).to_list(), ["Bob", "James", "Harry", "Mikey"])
+        self.assertEqual(await self.integers.distinct().to_list(), [1, 2, 3, 4, 5])
+
+    async def test_group_by_and_order_by(self):
+        groups = await self.strings.group_by(lambda s: s[0]).select(lambda g: g.as_tuple()).to_list()
+        self.assertEqual(groups, [("a", ["apple", "avocado"]), ("b", ["banana", "blueberry"])])
+        self.assertEqual(await self.integers.order_by_desc(async_double).take(2).to_list(), [5, 4])
+
+    async def test_concurrent_select(self):
+        running = 0
+        peak = 0
+
+        async def slow(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return x
+
+        result = await AsyncPynQuery(range(20)).select(slow, concurrency=4).to_list()
+        self.assertEqual(result, list(range(20)))
+        self.assertEqual(peak, 4)
+
+    async def test_first_stops_early(self):
+        pulled = []
+        source = AsyncPynQuery(produce(range(100))).select(lambda x: pulled.append(x) or x)
+        self.assertEqual(await source.first(lambda x: x > 2), 3)
+        self.assertEqual(pulled, [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            await AsyncPynQuery([]).first()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# tests/test_pynexpr.py
+import unittest
+from types import SimpleNamespace
+from operator import itemgetter
+from pynq import F, PynExpr
+from pynq.core import sum_of, order_by
+from pynq.pynquery import PynQuery
+from .test_data import test_data
+
+
+class TestPynExpr(unittest.TestCase):
+
+    def setUp(self):
+        self.dictionary = test_data["dictionary"]
+
+    def test_compile(self):
+        # Arrange:
+        item = SimpleNamespace(price=2.5, qty=4, tags=("a", "b"))
+        # Act & Assert:
+        self.assertIsInstance(F("year").compile(), itemgetter)
+        self.assertTrue((F("year") > 40)({"year": 41}))
+        self.assertTrue(F("name").startswith("T")({"name": "Terry"}))
+        self.assertEqual((F.attr("price") * F.attr("qty"))(item), 10.0)
+        self.assertEqual((1 - F())(3), -2)
+        self.assertTrue(F.attr("tags").contains("b")(item))
+        self.assertTrue((F("a", "b").isin([1, 2]) & ~F("c").is_none())({"a": {"b": 2}, "c": 0}))
+        self.assertFalse(F("x").between(1, 3)({"x": 4}))
+        self.assertEqual(F("s").apply(len)({"s": "abc"}), 3)
+
+    def test_bitwise_operators(self):
+        # Arrange:
+        rows = [{"flags": 5, "x": None}, {"flags": 2, "x": 7}]
+        # Act & Assert:
+        self.assertEqual([(F("flags") & 4)(r) for r in rows], [4, 0])
+        self.assertEqual([(F("flags") | 1)(r) for r in rows], [5, 3])
+        self.assertEqual((~F("flags"))(rows[0]), -6)
+        self.assertEqual([(~(F("flags") > 3))(r) for r in rows], [False, True])
+        self.assertEqual([(F("x").is_not_none() & (F("x") > 3))(r) for r in rows], [False, True])
+        self.assertEqual(PynQuery(rows).where((F("flags") & 4) | (F("flags") & 1)).count(), 1)
+
+    def test_keyword_attribute(self):
+        # Arrange:
+        item = SimpleNamespace(**{"class": 1, "from": SimpleNamespace(id=2)})
+        # Act & Assert:
+        self.assertTrue((F.attr("class") == 1)(item))
+        self.assertEqual((F.attr("from.id") + 1)(item), 3)
+
+    def test_no_truth_value(self):
+        # Arrange:
+        rows = [{"k": "a", "v": 0}, {"k": "b", "v": 2}]
+        # Act & Assert:
+        self.assertRaises(TypeError, bool, F("v") > 1)
+        self.assertTrue(PynQuery(rows).select(F("v")).has())
+        self.assertTrue(PynQuery(rows).has(F("v") > 1))
+        self.assertEqual(PynQuery(rows).first(F("v") > 1), rows[1])
+        self.assertEqual(PynQuery(rows).to_dict(F("k"), F("v")), {"a": 0, "b": 2})
+        self.assertEqual(PynQuery(rows).group_by(F("k"), F("v")).select(lambda g: (g.key, list(g))).to_list(), [("a", [0]), ("b", [2])])
+
+    def test_pickle_after_compile(self):
+        # Arrange:
+        import pickle
+        predicate = (F("year") > 40) & F("name").startswith("T")
+        predicate.compile()
+        # Act:
+        restored = pickle.loads(pickle.dumps(predicate))
+        result = PynQuery(self.dictionary).as_parallel(workers=2, chunk_size=2).where(predicate).count()
+        # Assert:
+        self.assertTrue(restored.same(predicate))
+        self.assertTrue(restored({"year": 42, "name": "TerryJ"}))
+        self.assertEqual(result, 1)
+
+    def test_inspect(self):
+        # Arrange:
+        expr = (F("year") >= 40) | F.attr("name").endswith("s")
+        # Act & Assert:
+        self.assertEqual(repr(expr), "((F('year') >= 40) or F.attr('name').endswith('s'))")
+        self.assertEqual(expr.fields(), {"year", "name"})
+        self.assertEqual(expr.op, "or")
+        self.assertTrue(F("year").is_field())
+        self.assertTrue((F("a") + 1).same(F("a") + 1))
+        self.assertFalse((F("a") + 1).same(F("a") + 1.0))
+        self.assertIsInstance(F("a") == 1, PynExpr)
+
+    def test_query(self):
+        # Arrange:
+        expected_result = [p["name"] for p in self.dictionary if p["year"] > 40 and p["name"].startswith("T")]
+        # Act:
+        query = PynQuery(self.dictionary).where(F("year") > 40).where(F("name").startswith("T")).select(F("name"))
+        # Assert:
+        self.assertEqual(query.to_list(), expected_result)
+        self.assertIn("fused[where((F('year') > 40))", query.explain())
+        self.assertEqual(PynQuery(self.dictionary).order_by_desc(F("year")).select(F("year")).first(), 43)
+        self.assertEqual(sum_of(self.dictionary, F() > 40, F("year")), sum(p["year"] for p in self.dictionary if p["year"] > 40))
+        self.assertEqual(order_by(self.dictionary, F("year")), sorted(self.dictionary, key=itemgetter("year")))
+
+    def test_indexed_where(self):
+        # Arrange:
+        query = PynQuery(self.dictionary).indexed(F("name"))
+        # Act:
+        result = query.where((F("year") > 0) & (F("name") == "TerryG")).to_list()
+        # Assert:
+        self.assertEqual(result, [p for p in self.dictionary if p["name"] == "TerryG"])
+        self.assertIsNotNone(query._index)
+
+
+if __name__ == '__main__':
+    unittest.main()
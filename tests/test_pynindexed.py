@@ -0,0 +1,65 @@
+# tests/test_pynindexed.py
+import unittest
+from pynq.pynquery import PynQuery
+from pynq.core import to_lookup, to_dict
+from .test_data import test_data
+
+
+class TestPynIndexed(unittest.TestCase):
+
+    def setUp(self):
+        self.year = lambda x: x["year"]
+        self.people = PynQuery(iter(test_data["dictionary"])).indexed(self.year, sorted_index=True)
+        self.films = test_data["films"]
+
+    def test_to_lookup(self):
+        result = to_lookup(test_data["strings"], lambda s: s[0], len)
+        self.assertEqual(result, {"a": [5, 7], "b": [6, 9]})
+        self.assertEqual(PynQuery(test_data["integers"]).to_lookup(lambda x: x % 2)[0], [2, 4, 2])
+
+    def test_to_dict(self):
+        result = PynQuery(test_data["dictionary"]).to_dict(lambda x: x["name"], self.year)
+        self.assertEqual(result["TerryJ"], 42)
+        self.assertRaises(ValueError, to_dict, test_data["dictionary"], self.year)
+
+    def test_where_key(self):
+        result = self.people.where_key(43).select(lambda x: x["name"])
+        self.assertEqual(result, ["MichaelP", "EricI"])
+        self.assertEqual(self.people.where_keys([40, 39, 40, 99]).select(lambda x: x["name"]), ["TerryG", "JohnC"])
+        self.assertEqual(self.people.where_key(99), [])
+
+    def test_where_range(self):
+        names = lambda q: q.select(lambda x: x["name"]).to_list()
+        self.assertEqual(names(self.people.where_range(40, 42)), ["TerryG", "GrahamC", "TerryJ"])
+        self.assertEqual(names(self.people.where_range(40, 42, include_low=False, include_high=False)), ["GrahamC"])
+        self.assertEqual(names(self.people.where_range(high=40)), ["JohnC", "TerryG"])
+        self.assertRaises(ValueError, PynQuery([]).indexed(len).where_range, 1, 2)
+
+    def test_contains_and_first(self):
+        self.assertTrue(self.people.contains_key(41))
+        self.assertTrue(self.people.contains(test_data["dictionary"][2]))
+        self.assertFalse(self.people.contains({"name": "Nobody", "year": 41}))
+        self.assertEqual(self.people.first_key(42)["name"], "TerryJ")
+        self.assertIsNone(self.people.first_or_default_key(1))
+        self.assertRaises(ValueError, self.people.first_key, 1)
+
+    def test_contains_foreign_item(self):
+        self.assertFalse(self.people.contains(5))
+        self.assertFalse(self.people.contains({"name": "NoYear"}))
+        self.assertEqual(self.people.contains(5), PynQuery(test_data["dictionary"]).contains(5))
+
+    def test_is_regular_query(self):
+        self.assertEqual(self.people.count(), 6)
+        self.assertEqual(self.people.where(lambda x: x["year"] > 42).count(), 2)
+        self.assertEqual(self.people.max(key_selector=self.year), 43)
+
+    def test_join_uses_index(self):
+        by_name = PynQuery(test_data["dictionary"]).indexed(lambda p: p["name"])
+        result = by_name.join(self.films, by_name.key_selector, lambda f: f["director"], lambda p, f: f["title"])
+        self.assertEqual(result, ["Holy Grail", "Life of Brian", "Meaning of Life", "Brazil"])
+        result = by_name.join(self.films, lambda p: p["name"], lambda f: f["director"], lambda p, f: f["title"])
+        self.assertEqual(result.count(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
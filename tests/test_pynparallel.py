@@ -0,0 +1,59 @@
+# tests/test_pynparallel.py
+import unittest
+from pynq.pynquery import PynQuery
+from .test_data import test_data
+
+
+def is_even(x):
+    return x % 2 == 0
+
+def square(x):
+    return x * x
+
+def first_letter(s):
+    return s[0]
+
+def people_of(x):
+    return x["people"]
+
+
+class TestPynParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.numbers = PynQuery(range(1000))
+        self.strings = PynQuery(test_data["strings"])
+
+    def test_parallel_ordered_to_list(self):
+        expected = [square(x) for x in range(1000) if is_even(x)]
+        result = self.numbers.as_parallel(workers=2, chunk_size=64).where(is_even).select(square).as_ordered().to_list()
+        self.assertEqual(result, expected)
+
+    def test_parallel_unordered_to_list(self):
+        result = self.numbers.as_parallel(workers=2, chunk_size=64).select(square).to_list()
+        self.assertEqual(sorted(result), [square(x) for x in range(1000)])
+
+    def test_parallel_aggregates(self):
+        query = self.numbers.as_parallel(workers=2, chunk_size=100).where(is_even)
+        self.assertEqual(query.count(), 500)
+        self.assertEqual(query.sum(), sum(range(0, 1000, 2)))
+        self.assertEqual(query.min(), 0)
+        self.assertEqual(query.max(), 998)
+        self.assertEqual(query.avg(), 499.0)
+        self.assertIsNone(PynQuery([]).as_parallel(workers=1).min())
+
+    def test_parallel_select_many(self):
+        result = PynQuery(test_data["nested_dict"]).as_parallel(workers=2, chunk_size=1).select_many(people_of).as_ordered().to_list()
+        self.assertEqual(result, [p for x in test_data["nested_dict"] for p in x["people"]])
+
+    def test_parallel_distinct_and_group_by(self):
+        self.assertEqual(PynQuery(test_data["integers"]).as_parallel(workers=2, chunk_size=2).as_ordered().distinct(), [1, 2, 3, 4, 5])
+        result = [g.as_tuple() for g in self.strings.as_parallel(workers=2, chunk_size=1).as_ordered().group_by(first_letter)]
+        self.assertEqual(result, [("a", ["apple", "avocado"]), ("b", ["banana", "blueberry"])])
+
+    def test_parallel_as_sequential(self):
+        result = self.numbers.as_parallel(workers=2).as_ordered().select(square).as_sequential().take(3)
+        self.assertEqual(result, [0, 1, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
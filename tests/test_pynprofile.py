@@ -0,0 +1,60 @@
+# tests/test_pynprofile.py
+import unittest
+from pynq import set_profile_hook
+from pynq.pynquery import PynQuery
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+class TestPynProfile(unittest.TestCase):
+
+    def test_explain(self):
+        # Arrange:
+        query = PynQuery(list(range(10))).where(is_even).select(str).order_by(len).take(3)
+        # Act:
+        result = query.explain()
+        # Assert:
+        self.assertEqual(result.splitlines(), [
+            "source: list[10]",
+            "-> fused[where(is_even), select(str)]",
+            "-> take_ordered_keys(3, ((len, False)))",
+        ])
+
+    def test_profile_rows(self):
+        # Arrange:
+        query = PynQuery(x for x in range(100)).where(is_even).select(lambda x: x * 2).order_by_desc(lambda x: x).take(5)
+        # Act:
+        result = query.profile()
+        # Assert:
+        self.assertEqual([s.name for s in result.stages], ["source", "where", "select", "take_ordered_keys"])
+        self.assertEqual([(s.rows_in, s.rows_out) for s in result.stages], [(100, 100), (100, 50), (50, 50), (50, 5)])
+        self.assertEqual(result.rows, 5)
+        self.assertEqual(result.stages[-1].materialized, 5)
+        self.assertTrue(all(s.user_seconds <= s.seconds + 1e-3 for s in result.stages))
+        self.assertAlmostEqual(result.seconds, sum(s.seconds for s in result.stages))
+
+    def test_profile_hook(self):
+        # Arrange:
+        profiles = []
+        query = PynQuery(range(10)).where(is_even)
+        # Act:
+        query.profile(profiles.append)
+        set_profile_hook(profiles.append)
+        try:
+            result = query.select(lambda x: x + 1).to_list()
+            first = query.first()
+        finally:
+            set_profile_hook(None)
+        # Assert:
+        self.assertEqual(result, [1, 3, 5, 7, 9])
+        self.assertEqual(first, 0)
+        self.assertEqual([p.rows for p in profiles], [5, 5, 1])
+        self.assertIn("where", profiles[0].report())
+        self.assertEqual(query.to_list(), [0, 2, 4, 6, 8])
+        self.assertEqual(len(profiles), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -129,6 +129,185 @@ class TestPYNQ(unittest.TestCase):
         result = self.integers.skip_last(2)
         self.assertEqual(result, [1, 2, 3, 4, 5])
 
+    def test_pynquery_fused_chain(self):
+        result = self.integers.where(lambda x: x > 1).select(lambda x: x * 10).where(lambda x: x != 30).take(3)
+        self.assertEqual(result, [20, 40, 50])
+
+    def test_pynquery_is_deferred(self):
+        pulled = []
+        source = (pulled.append(x) or x for x in range(1000))
+        query = PynQuery(source).where(lambda x: x % 2 == 0).select(lambda x: x + 1)
+        self.assertEqual(pulled, [])
+        self.assertEqual(query.take(2).to_list(), [1, 3])
+        self.assertEqual(pulled, [0, 1, 2])
+
+    def test_pynquery_first_stops_early(self):
+        pulled = []
+        source = (pulled.append(x) or x for x in range(1000))
+        self.assertEqual(PynQuery(source).select(lambda x: x * 2).first(lambda x: x > 6), 8)
+        self.assertEqual(pulled, [0, 1, 2, 3, 4])
+
+    def test_pynquery_reexecutes_over_list(self):
+        query = self.integers.where(lambda x: x % 2 == 0)
+        self.assertEqual(query.count(), 3)
+        self.assertEqual(query.to_list(), [2, 4, 2])
+        self.assertTrue(query.any())
+        self.assertFalse(query.where(lambda x: x > 10).any())
+
+    def test_pynquery_take_skip_collapse(self):
+        self.assertEqual(self.integers.skip(1).skip(2).take(3).take(2), [4, 5])
+
+    def test_pynquery_concatenate(self):
+        self.assertEqual(self.integers.take(2).concatenate([8, 9], (10,)), [1, 2, 8, 9, 10])
+
+    def test_pynquery_order_by_take_is_stable(self):
+        selector = lambda x: x["year"]
+        expected = sorted(test_data["dictionary"], key=selector)[:4]
+        self.assertEqual(self.dictionary.order_by(selector).take(4), expected)
+        self.assertEqual(self.dictionary.order_by(selector).take(10), sorted(test_data["dictionary"], key=selector))
+
+    def test_pynquery_order_by_take_negative(self):
+        selector = lambda x: x["year"]
+        self.assertRaises(ValueError, self.dictionary.order_by(selector).take(-1).to_list)
+        self.assertRaises(ValueError, self.dictionary.order_by(selector).skip(5).take(-1).to_list)
+        self.assertRaises(ValueError, self.integers.skip(1).skip(-1).to_list)
+
+    def test_pynquery_order_by_desc_first(self):
+        result = PynQuery(iter(test_data["dictionary"])).order_by_desc(lambda x: x["year"]).first()
+        self.assertEqual(result["name"], "MichaelP")
+
+    def test_pynquery_order_by_where_skip_take(self):
+        result = self.integers.order_by(lambda x: -x).where(lambda x: x != 4).skip(1).take(2)
+        self.assertEqual(result, [3, 3])
+        self.assertEqual(self.integers.order_by(lambda x: x).first(lambda x: x > 2), 3)
+        self.assertIsNone(self.empty.order_by(lambda x: x).first_or_default())
+
+    def test_pynquery_with_max(self):
+        result = self.dictionary.with_max(key_selector=lambda x: x["year"]).select(lambda x: x["name"])
+        self.assertEqual(result, ["MichaelP", "EricI"])
+
+    def test_pynquery_min_max_by(self):
+        self.assertEqual(self.strings.min_by(len), "apple")
+        self.assertEqual(self.strings.maxBy(len), "blueberry")
+        self.assertEqual(self.strings.min_max_by(len), ("apple", "blueberry"))
+
+    def test_pynquery_select_concurrent(self):
+        result = self.integers.where(lambda x: x > 2).select_concurrent(lambda x: x * 10, max_workers=4).take(3)
+        self.assertEqual(result, [30, 40, 50])
+
+    def test_pynquery_memoize(self):
+        calls = []
+        source = (x for x in test_data["integers"])
+        query = PynQuery(source).select(lambda x: calls.append(x) or x * 2).memoize()
+        self.assertEqual(query.take(2), [2, 4])
+        self.assertEqual(query.count(), 7)
+        self.assertEqual(query.to_list(), [2, 4, 6, 8, 10, 4, 6])
+        self.assertEqual(query.sum(), 40)
+        self.assertEqual(calls, test_data["integers"])
+
+    def test_pynquery_memoize_shared_iterators(self):
+        query = PynQuery(iter(range(5))).buffered()
+        left, right = iter(query), iter(query)
+        self.assertEqual([next(left), next(left), next(right)], [0, 1, 0])
+        self.assertEqual(list(right), [1, 2, 3, 4])
+        self.assertEqual(list(left), [2, 3, 4])
+
+    def test_pynquery_memoize_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        calls = []
+        query = PynQuery(range(10000)).select(lambda x: calls.append(x) or x).memoize()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: query.to_list(), range(8)))
+        self.assertTrue(all(r == list(range(10000)) for r in results))
+        self.assertEqual(len(calls), 10000)
+
+    def test_pynquery_memoize_upstream_error(self):
+        def failing():
+            yield 1
+            raise ValueError("boom")
+        query = PynQuery(failing()).memoize()
+        self.assertRaises(ValueError, query.to_list)
+        self.assertRaises(ValueError, query.to_list)
+        self.assertEqual(query.take(1), [1])
+
+    def test_pynquery_then_by(self):
+        calls = []
+        year = lambda x: calls.append(x) or x["year"]
+        result = self.dictionary.order_by_desc(year).then_by(lambda x: x["name"]).select(lambda x: x["name"])
+        self.assertEqual(result.to_list(), ["EricI", "MichaelP", "TerryJ", "GrahamC", "TerryG", "JohnC"])
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(self.dictionary.order_by(lambda x: x["name"][0]).then_by_desc(lambda x: x["year"]).take(2).select(lambda x: x["name"]), ["EricI", "GrahamC"])
+
+    def test_pynquery_then_by_requires_order_by(self):
+        self.assertRaises(ValueError, self.integers.where(lambda x: x).then_by, lambda x: x)
+
+    def test_pynquery_join(self):
+        films = PynQuery(test_data["films"]).where(lambda f: f["year"] < 1980)
+        result = self.dictionary.join(films, lambda p: p["name"], lambda f: f["director"], lambda p, f: f["title"])
+        self.assertEqual(result, ["Holy Grail", "Life of Brian"])
+        result = self.dictionary.group_join(films, lambda p: p["name"], lambda f: f["director"]).where(lambda g: g[1]).count()
+        self.assertEqual(result, 2)
+        result = self.dictionary.left_join(films, lambda p: p["name"], lambda f: f["director"]).count()
+        self.assertEqual(result, 6)
+
+    def test_pynquery_set_operators(self):
+        self.assertEqual(self.integers.union([6, 1]), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.integers.intersect(PynQuery(range(3, 10))), [3, 4, 5])
+        self.assertEqual(self.integers.except_([1, 5]).take(2), [2, 3])
+        self.assertEqual(self.dictionary.distinct_by(lambda x: x["year"]).count(), 5)
+        self.assertEqual(self.strings.exceptBy(["avocado"], lambda s: s[0]), ["banana"])
+
+    def test_pynquery_group_adjacent(self):
+        result = self.strings.group_adjacent(lambda s: s[0]).select(lambda g: g.as_tuple())
+        self.assertEqual(result, [("a", ["apple"]), ("b", ["banana"]), ("a", ["avocado"]), ("b", ["blueberry"])])
+        result = self.strings.order_by(lambda s: s[0]).group_by(lambda s: s[0], presorted=True).select(lambda g: g.key)
+        self.assertEqual(result, ["a", "b"])
+
+    def test_pynquery_group_aggregate(self):
+        result = self.integers.group_aggregate(lambda x: x % 2, count="count", total=("sum",), top="max")
+        self.assertEqual(result, [(1, {"count": 4, "total": 12, "top": 5}), (0, {"count": 3, "total": 8, "top": 4})])
+
+    def test_pynquery_stats_single_pass(self):
+        source = (x for x in test_data["integers"])
+        result = PynQuery(source).where(lambda x: x > 1).stats()
+        self.assertEqual((result.count, result.sum, result.min, result.max, result.avg), (6, 19, 2, 5, 19 / 6))
+        self.assertEqual(self.integers.aggregate_many(total=("sum",), top="max"), {"total": 20, "top": 5})
+
+    def test_pynquery_chunk(self):
+        self.assertEqual(self.integers.where(lambda x: x > 1).chunk(2).select(list), [[2, 3], [4, 5], [2, 3]])
+        self.assertEqual(self.integers.chunk(5).select(len), [5, 2])
+        self.assertEqual(self.integers.batch_select(lambda b: [max(b)] * len(b), 4), [4, 4, 4, 4, 5, 5, 5])
+
+    def test_pynquery_order_by_memory_limit(self):
+        result = PynQuery(range(1000, 0, -1)).order_by(lambda x: x % 10, memory_limit=64).then_by_desc(lambda x: x).take(3)
+        self.assertEqual(result, [1000, 990, 980])
+        result = PynQuery(x for x in range(500)).order_by_desc(lambda x: x % 7, memory_limit=50).select(lambda x: x % 7).distinct()
+        self.assertEqual(result, [6, 5, 4, 3, 2, 1, 0])
+
+    def test_pynquery_group_by_memory_limit(self):
+        result = PynQuery(range(200)).group_by(lambda x: x % 5, memory_limit=20).select(lambda g: (g.key, g.as_queryable().count()))
+        self.assertEqual(sorted(result), [(k, 40) for k in range(5)])
+
+    def test_pynquery_sequence_fast_paths(self):
+        calls = []
+        query = PynQuery(list(range(100000))).select(lambda x: calls.append(x) or x * 2)
+        self.assertEqual(query.count(), 100000)
+        self.assertEqual(query.last(), 199998)
+        self.assertEqual(query.skip(10).take(2).to_list(), [20, 22])
+        self.assertEqual(calls, [99999, 10, 11])
+
+    def test_pynquery_group_by_compact(self):
+        result = self.strings.group_by_compact(lambda s: s[0]).select(lambda g: (g.key, g.as_queryable().count()))
+        self.assertEqual(result, [("a", 2), ("b", 2)])
+        self.assertEqual(self.integers.to_group_index(lambda x: x % 3).keys(), [1, 2, 0])
+        self.assertEqual(self.integers.group_by_compact(lambda x: x % 3).count(), 3)
+
+    def test_pynquery_take_last_deque(self):
+        from collections import deque
+        self.assertEqual(PynQuery(deque([1, 2, 3])).take_last(2).to_list(), [2, 3])
+        self.assertEqual(PynQuery(deque([1, 2, 3])).skip_last(2).to_list(), [1])
+
+
 '''
     def test_group_by(self):
         # Arrange:
@@ -0,0 +1,81 @@
+# tests/test_sources.py
+import json
+import os
+import tempfile
+import unittest
+from pynq.pynquery import PynQuery
+from pynq.sources import read_lines, read_csv, read_jsonl
+from .test_data import test_data
+
+
+class TestSources(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lines_path = self._write("lines.txt", "alpha\r\nbeta\n\ngamma")
+        self.csv_path = self._write("people.csv", "name,year,city\n" + "".join(f"{p['name']},{p['year']},London\n" for p in test_data["dictionary"]))
+        self.jsonl_path = self._write("people.jsonl", "\n".join(json.dumps(p) for p in test_data["dictionary"]) + "\n\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        return path
+
+    def test_read_lines(self):
+        expected = ["alpha", "beta", "", "gamma"]
+        self.assertEqual(list(read_lines(self.lines_path)), expected)
+        self.assertEqual(list(read_lines(self.lines_path, use_mmap=True)), expected)
+        self.assertEqual(list(read_lines(self._write("empty.txt", ""), use_mmap=True)), [])
+
+    def test_read_lines_mixed_newlines(self):
+        path = self._write("mixed.txt", "a\rb\r\n\rc\n\r\nd\r")
+        expected = list(read_lines(path))
+        self.assertEqual(expected, ["a", "b", "", "c", "", "d"])
+        self.assertEqual(list(read_lines(path, use_mmap=True)), expected)
+
+    def test_from_lines_is_lazy_and_reiterable(self):
+        query = PynQuery.from_lines(self.lines_path).where(lambda s: s).select(str.upper)
+        self.assertEqual(query.take(2), ["ALPHA", "BETA"])
+        self.assertEqual(query.count(), 3)
+
+    def test_read_csv_projection(self):
+        converted = []
+        to_int = lambda v: converted.append(v) or int(v)
+        rows = list(read_csv(self.csv_path, columns=["year", "name"], converters={"year": to_int, "city": self.fail}))
+        self.assertEqual(rows[0], {"year": 43, "name": "MichaelP"})
+        self.assertEqual(len(converted), 6)
+        self.assertRaises(KeyError, list, read_csv(self.csv_path, columns=["age"]))
+
+    def test_read_csv_without_header(self):
+        rows = list(read_csv(self.csv_path, columns=[0], header=False))
+        self.assertEqual(rows[:2], [{0: "name"}, {0: "MichaelP"}])
+
+    def test_read_csv_blank_and_short_rows(self):
+        path = self._write("ragged.csv", "name,year,city\r\nTerryG,40,Minneapolis\r\n\r\nEricI,43\r\n\r\n")
+        rows = list(read_csv(path, converters={"year": int}))
+        self.assertEqual(rows, [{"name": "TerryG", "year": 40, "city": "Minneapolis"}, {"name": "EricI", "year": 43, "city": None}])
+        rows = list(read_csv(path, columns=["city"], header=True))
+        self.assertEqual(rows, [{"city": "Minneapolis"}, {"city": None}])
+
+    def test_from_csv(self):
+        query = PynQuery.from_csv(self.csv_path, columns=["name", "year"], converters={"year": int})
+        self.assertEqual(query.where(lambda r: r["year"] > 42).select(lambda r: r["name"]), ["MichaelP", "EricI"])
+
+    def test_from_jsonl(self):
+        self.assertEqual(list(read_jsonl(self.jsonl_path)), test_data["dictionary"])
+        query = PynQuery.from_jsonl(self.jsonl_path, fields=["year"])
+        self.assertEqual(query.first(), {"year": 43})
+        self.assertEqual(query.sum(key_selector=lambda r: r["year"]), 248)
+
+    def test_read_jsonl_fields_non_object(self):
+        path = self._write("mixed.jsonl", '{"year": 1}\n[1, 2]\n')
+        self.assertEqual(list(read_jsonl(path)), [{"year": 1}, [1, 2]])
+        self.assertRaisesRegex(ValueError, "Line 2", list, read_jsonl(path, fields=["year"]))
+
+
+if __name__ == '__main__':
+    unittest.main()